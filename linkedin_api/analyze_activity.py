@@ -16,15 +16,21 @@ Use extract_graph_data.py to extract data for Neo4j import.
 """
 
 import argparse
-import json
 import os
-from collections import Counter
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
+
+import orjson
+
 from linkedin_api.utils.changelog import fetch_changelog_data
 from linkedin_api.utils.summaries import print_resource_summary, summarize_resources
 
+# orjson options for the statistics JSON files
+JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 # Output directory
 OUTPUT_DIR = Path("outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -58,15 +64,40 @@ def get_all_changelog_data(start_time: Optional[int] = None):
     return fetch_changelog_data(start_time=start_time)
 
 
-def extract_statistics(elements):
-    """Extract statistics from changelog elements and track data quality."""
+@lru_cache(maxsize=None)
+def _classify_resource(resource_name):
+    """Map a changelog resourceName to its statistics bucket, or None.
+
+    Resource names come from a small fixed vocabulary, so the substring checks
+    run once per distinct name instead of once per element.
+    """
+    name = resource_name.lower()
+    if "messages" in name:
+        return "messages"
+    if "invitation" in name:
+        return "invites"
+    if "socialActions/likes" in resource_name or "reaction" in name:
+        return "reactions"
+    if "ugcPosts" in resource_name:
+        return "posts"
+    if "comment" in name:
+        return "comments"
+    return None
+
+
+def extract_statistics(elements, keep_raw_skipped=False):
+    """Extract statistics from changelog elements and track data quality.
+
+    Skipped elements are recorded by their identifying fields only; pass
+    keep_raw_skipped=True to also keep the full raw element for debugging.
+    """
 
     resource_types, method_types, resource_examples = summarize_resources(elements)
 
     stats: dict[str, Any] = {
         "messages": {"sent": 0, "received": 0, "total": 0},
         "invites": {"sent": 0, "received": 0, "total": 0},
-        "reactions": Counter(),
+        "reactions": defaultdict(int),
         "posts": {"original": 0, "repost": 0, "repost_with_comment": 0, "total": 0},
         "comments": {"total": 0},
         "resource_types": resource_types,
@@ -76,7 +107,7 @@ def extract_statistics(elements):
             "total_elements": len(elements),
             "importable": 0,
             "skipped": 0,
-            "skipped_by_reason": Counter(),
+            "skipped_by_reason": defaultdict(int),
             "reactions_importable": 0,
             "reactions_incomplete": 0,
             "comments_importable": 0,
@@ -87,11 +118,14 @@ def extract_statistics(elements):
     # Track skipped elements for investigation
     skipped_elements = []
 
+    dq = stats["data_quality"]
+
     # Track actor to determine if action is by user
     user_actor = None
 
     for element in elements:
         resource_name = element.get("resourceName", "")
+        kind = _classify_resource(resource_name)
         actor = element.get("actor", "")
         activity = element.get("activity", {})
         is_importable = True
@@ -102,7 +136,7 @@ def extract_statistics(elements):
             user_actor = actor
 
         # Messages (DMs)
-        if "messages" in resource_name.lower():
+        if kind == "messages":
             stats["messages"]["total"] += 1
             if actor == user_actor:
                 stats["messages"]["sent"] += 1
@@ -110,7 +144,7 @@ def extract_statistics(elements):
                 stats["messages"]["received"] += 1
 
         # Invitations
-        elif "invitation" in resource_name.lower():
+        elif kind == "invites":
             stats["invites"]["total"] += 1
             if actor == user_actor:
                 stats["invites"]["sent"] += 1
@@ -118,10 +152,7 @@ def extract_statistics(elements):
                 stats["invites"]["received"] += 1
 
         # Reactions - validate for Neo4j import
-        elif (
-            "socialActions/likes" in resource_name
-            or "reaction" in resource_name.lower()
-        ):
+        elif kind == "reactions":
             reaction_type = activity.get("reactionType", "UNKNOWN")
             stats["reactions"][reaction_type] += 1
 
@@ -132,16 +163,16 @@ def extract_statistics(elements):
             if not post_urn:
                 is_importable = False
                 skip_reason = "reaction_no_post_urn"
-                stats["data_quality"]["reactions_incomplete"] += 1
+                dq["reactions_incomplete"] += 1
             elif not reaction_actor:
                 is_importable = False
                 skip_reason = "reaction_no_actor"
-                stats["data_quality"]["reactions_incomplete"] += 1
+                dq["reactions_incomplete"] += 1
             else:
-                stats["data_quality"]["reactions_importable"] += 1
+                dq["reactions_importable"] += 1
 
         # Posts (UGC Posts)
-        elif "ugcPost" in resource_name.lower() or "ugcPosts" in resource_name:
+        elif kind == "posts":
             stats["posts"]["total"] += 1
 
             # Determine post type from activity
@@ -156,7 +187,7 @@ def extract_statistics(elements):
                 stats["posts"]["original"] += 1
 
         # Comments - validate for Neo4j import
-        elif "comment" in resource_name.lower() or "comments" in resource_name.lower():
+        elif kind == "comments":
             stats["comments"]["total"] += 1
 
             # Check if comment has required fields
@@ -167,31 +198,35 @@ def extract_statistics(elements):
             if not comment_id:
                 is_importable = False
                 skip_reason = "comment_no_id"
-                stats["data_quality"]["comments_incomplete"] += 1
+                dq["comments_incomplete"] += 1
             elif not post_urn:
                 is_importable = False
                 skip_reason = "comment_no_post_urn"
-                stats["data_quality"]["comments_incomplete"] += 1
+                dq["comments_incomplete"] += 1
             elif not comment_actor:
                 is_importable = False
                 skip_reason = "comment_no_actor"
-                stats["data_quality"]["comments_incomplete"] += 1
+                dq["comments_incomplete"] += 1
             else:
-                stats["data_quality"]["comments_importable"] += 1
+                dq["comments_importable"] += 1
 
         # Track skipped elements
         if not is_importable:
-            stats["data_quality"]["skipped"] += 1
-            stats["data_quality"]["skipped_by_reason"][skip_reason] += 1
-            skipped_elements.append(
-                {
-                    "reason": skip_reason,
-                    "resource_name": resource_name,
-                    "element": element,
-                }
-            )
+            dq["skipped"] += 1
+            dq["skipped_by_reason"][skip_reason] += 1
+            skipped = {
+                "reason": skip_reason,
+                "resource_name": resource_name,
+                "element_id": element.get("id"),
+                "activity_id": activity.get("id"),
+                "activity_object": activity.get("object"),
+                "activity_actor": activity.get("actor"),
+            }
+            if keep_raw_skipped:
+                skipped["element"] = element
+            skipped_elements.append(skipped)
         else:
-            stats["data_quality"]["importable"] += 1
+            dq["importable"] += 1
 
     stats["skipped_elements"] = skipped_elements
 
@@ -224,7 +259,7 @@ def print_statistics(stats):
     print(f"   Importable to graph: {stats['data_quality']['reactions_importable']}")
     print(f"   Incomplete (skipped): {stats['data_quality']['reactions_incomplete']}")
     print(f"   By type:")
-    for reaction_type, count in stats["reactions"].most_common():
+    for reaction_type, count in sorted(stats["reactions"].items(), key=lambda x: -x[1]):
         print(f"     • {reaction_type}: {count}")
 
     # Posts
@@ -277,7 +312,7 @@ def save_statistics(stats, filename="linkedin_statistics.json"):
     filename = f"{base_name}_{timestamp}{ext}"
     filepath = OUTPUT_DIR / filename
 
-    # Convert Counter objects to dicts for JSON serialization
+    # Convert counters to plain dicts for JSON serialization
     stats_json = {
         "messages": stats["messages"],
         "invites": stats["invites"],
@@ -299,16 +334,18 @@ def save_statistics(stats, filename="linkedin_statistics.json"):
         },
     }
 
-    with open(filepath, "w") as f:
-        json.dump(stats_json, f, indent=2, default=str)
+    filepath.write_bytes(
+        orjson.dumps(stats_json, default=str, option=JSON_DUMP_OPTIONS)
+    )
 
     print(f"💾 Statistics saved to {filepath}")
 
     # Save skipped elements to separate file for investigation
     skipped_elements = stats.get("skipped_elements", [])
     skipped_filepath = OUTPUT_DIR / filename.replace(".json", "_skipped.json")
-    with open(skipped_filepath, "w") as f:
-        json.dump(skipped_elements, f, indent=2, default=str)
+    skipped_filepath.write_bytes(
+        orjson.dumps(skipped_elements, default=str, option=JSON_DUMP_OPTIONS)
+    )
     print(
         f"💾 Skipped elements saved to {skipped_filepath} "
         f"({len(skipped_elements)} elements)"
@@ -325,6 +362,11 @@ def main():
         dest="start_date",
         help="Start date/time (ISO 8601 or epoch ms) for statistics.",
     )
+    parser.add_argument(
+        "--keep-raw-skipped",
+        action="store_true",
+        help="Keep full raw elements in the skipped elements file.",
+    )
     args = parser.parse_args()
 
     start_time = parse_start_time(args.start_date)
@@ -344,7 +386,7 @@ def main():
 
     # Extract statistics
     print("\n🔍 Analyzing data...")
-    stats = extract_statistics(elements)
+    stats = extract_statistics(elements, keep_raw_skipped=args.keep_raw_skipped)
 
     # Print statistics
     print_statistics(stats)
@@ -20,11 +20,11 @@ by enrich_graph.py (Phase B).
 """
 
 import json
-
-import dotenv
+from itertools import chain
 from os import getenv
 from typing import List
 
+import dotenv
 from neo4j import GraphDatabase
 
 from linkedin_api.activity_csv import (
@@ -437,7 +437,7 @@ def _records_to_nodes_and_rels(
                 f"(allowed: {PHASE_A_RELATIONSHIP_TYPES})"
             )
 
-    nodes = list(people.values()) + list(posts.values()) + list(comments.values())
+    nodes = list(chain(people.values(), posts.values(), comments.values()))
     return nodes, relationships
 
 
@@ -16,11 +16,16 @@ This is Step 1 of the graph building workflow:
 import argparse
 import json
 import os
+import sys
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any, List, Optional
 
+import orjson
+
 from linkedin_api.activity_csv import (
     ActivityRecord,
     ActivityType,
@@ -55,11 +60,35 @@ RESOURCE_POSTS = "ugcPosts"
 RESOURCE_POST = "ugcPost"
 RESOURCE_INSTANT_REPOSTS = "instantReposts"
 
+# Write buffer for save_neo4j_data (bytes)
+SAVE_BUFFER_SIZE = 1024 * 1024
+
+# URN prefixes of top-level posts (shares and UGC posts)
+POST_URN_PREFIXES = ("urn:li:share:", "urn:li:ugcPost:")
+
 # Output directory
 OUTPUT_DIR = Path("outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 
+@lru_cache(maxsize=None)
+def _classify_resource(resource_name):
+    """Map a changelog resourceName to the kind of element it carries.
+
+    Resource names come from a small fixed vocabulary, so the substring checks
+    run once per distinct name instead of once per element.
+    """
+    if RESOURCE_REACTIONS in resource_name:
+        return RESOURCE_REACTIONS
+    if RESOURCE_POST in resource_name.lower() or RESOURCE_POSTS in resource_name:
+        return RESOURCE_POSTS
+    if RESOURCE_COMMENTS in resource_name:
+        return RESOURCE_COMMENTS
+    if RESOURCE_INSTANT_REPOSTS in resource_name:
+        return RESOURCE_INSTANT_REPOSTS
+    return None
+
+
 def _add_trace(trace_list, json_path, value_used, field_name):
     """Append a trace entry if trace_list is provided."""
     if trace_list is not None:
@@ -80,31 +109,65 @@ def format_timestamp(timestamp):
     return datetime.fromtimestamp(timestamp / 1000).isoformat()
 
 
+def _nested_get(container, *keys):
+    """Walk nested dicts by key, returning None as soon as a level is missing.
+
+    Avoids the throwaway ``{}`` defaults of chained ``.get(key, {})`` lookups.
+    """
+    for key in keys:
+        if not isinstance(container, dict):
+            return None
+        container = container.get(key)
+        if container is None:
+            return None
+    return container
+
+
 def _get_activity_timestamp(element: dict, activity: dict):
     """Resolve best-effort timestamp for an activity.
 
     Some reaction payloads provide ``created`` without ``time`` and only expose
     changelog-level ``processedAt``.
     """
-    created = activity.get("created", {})
-    if isinstance(created, dict):
-        ts = created.get("time")
-        if ts:
-            return ts
+    ts = _nested_get(activity, "created", "time")
+    if ts:
+        return ts
     ts = element.get("processedAt")
     if ts:
         return ts
     return None
 
 
+def _share_commentary_text(activity):
+    """Return the share commentary text of a post activity, if any."""
+    return _nested_get(
+        activity,
+        "specificContent",
+        "com.linkedin.ugc.ShareContent",
+        "shareCommentary",
+        "text",
+    )
+
+
+def _intern(value):
+    """Intern string values that repeat across many nodes and relationships.
+
+    URNs and reaction types parsed from JSON are fresh string objects per
+    element; interning them keeps a single copy and speeds up dict lookups.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
 def create_person_node(person_urn, people):
     """Create a Person node if it doesn't exist."""
-    if not person_urn or not person_urn.startswith("urn:li:person:"):
-        return None
-
     if person_urn in people:
         return person_urn
 
+    if not person_urn or not person_urn.startswith("urn:li:person:"):
+        return None
+
     person_id = extract_urn_id(person_urn)
     if not person_id:
         return None
@@ -147,7 +210,7 @@ def create_post_node(post_urn, posts, additional_props=None):
 
 def extract_actor(element, activity):
     """Extract actor URN from element or activity."""
-    return element.get("actor", "") or activity.get("actor", "")
+    return _intern(element.get("actor", "") or activity.get("actor", ""))
 
 
 def _extract_post_urn_for_reaction(element, activity):
@@ -209,15 +272,9 @@ def _is_comment_like_activity(activity):
     if not has_message or not has_object:
         return False
     activity_id = activity.get("id", "")
-    if isinstance(activity_id, str) and (
-        activity_id.startswith("urn:li:share:")
-        or activity_id.startswith("urn:li:ugcPost:")
-    ):
+    if isinstance(activity_id, str) and activity_id.startswith(POST_URN_PREFIXES):
         return False
-    share_content = activity.get("specificContent", {}).get(
-        "com.linkedin.ugc.ShareContent", {}
-    )
-    if share_content:
+    if _nested_get(activity, "specificContent", "com.linkedin.ugc.ShareContent"):
         return False
     return True
 
@@ -265,8 +322,8 @@ def process_reaction(
 ):
     """Process a reaction element and update entities/relationships."""
     resource_name = element.get("resourceName", "")
-    post_urn = _extract_post_urn_for_reaction(element, activity)
-    reaction_type = activity.get("reactionType", "UNKNOWN")
+    post_urn = _intern(_extract_post_urn_for_reaction(element, activity))
+    reaction_type = _intern(activity.get("reactionType", "UNKNOWN"))
     actor = extract_actor(element, activity)
     is_delete = _is_delete_action(element)
     if trace is not None:
@@ -280,15 +337,15 @@ def process_reaction(
         _add_trace(
             trace,
             "activity.created.time",
-            activity.get("created", {}).get("time"),
+            _nested_get(activity, "created", "time"),
             "timestamp",
         )
 
     if not post_urn:
-        skipped_by_reason[f"reaction_no_post_urn_{resource_name}"] += 1
+        skipped_by_reason[("reaction_no_post_urn", resource_name)] += 1
         return
     if not actor:
-        skipped_by_reason[f"reaction_no_actor_{resource_name}"] += 1
+        skipped_by_reason[("reaction_no_actor", resource_name)] += 1
         return
 
     if is_delete:
@@ -321,82 +378,79 @@ def process_post(
 ):
     """Process a post element and update entities/relationships."""
     resource_name = element.get("resourceName", "")
-    post_urn = activity.get("id", "")
+    post_urn = _intern(activity.get("id", ""))
     if trace is not None:
         _add_trace(trace, "activity.id", post_urn, "post_urn")
         _add_trace(trace, "activity.author", activity.get("author"), "author")
         _add_trace(
             trace,
             "activity.created.time",
-            activity.get("created", {}).get("time"),
+            _nested_get(activity, "created", "time"),
             "timestamp",
         )
-        share_content = activity.get("specificContent", {}).get(
-            "com.linkedin.ugc.ShareContent", {}
-        )
         _add_trace(
             trace,
             "activity.specificContent...shareCommentary.text",
-            share_content.get("shareCommentary", {}).get("text", "")[:100],
+            (_share_commentary_text(activity) or "")[:100],
             "content",
         )
         _add_trace(
             trace,
             "activity.responseContext.parent",
-            activity.get("responseContext", {}).get("parent"),
+            _nested_get(activity, "responseContext", "parent"),
             "original_post_urn",
         )
 
     if not post_urn:
-        skipped_by_reason[f"post_no_id_{resource_name}"] += 1
+        skipped_by_reason[("post_no_id", resource_name)] += 1
         return
 
-    if not (
-        post_urn.startswith("urn:li:share:") or post_urn.startswith("urn:li:ugcPost:")
-    ):
+    if not post_urn.startswith(POST_URN_PREFIXES):
         return
 
     timestamp = _get_activity_timestamp(element, activity)
+    created_at = format_timestamp(timestamp)
     actor = extract_actor(element, activity)
     is_repost = activity.get("ugcOrigin") == "RESHARE" or bool(
-        activity.get("responseContext", {}).get("parent")
+        _nested_get(activity, "responseContext", "parent")
     )
     if is_repost:
         author = actor
     else:
         author = (
             activity.get("author")
-            or activity.get("firstPublishedActor", {}).get("member", "")
+            or _nested_get(activity, "firstPublishedActor", "member")
             or actor
         )
     post_type = "repost" if is_repost else "original"
 
-    share_content = activity.get("specificContent", {}).get(
-        "com.linkedin.ugc.ShareContent", {}
-    )
-    content = share_content.get("shareCommentary", {}).get("text", "")
+    content = _share_commentary_text(activity) or ""
     original_post_urn = None
 
     if is_repost:
-        original_post_urn = activity.get("responseContext", {}).get(
-            "parent"
-        ) or activity.get("responseContext", {}).get("root")
-
-    post_props = {
-        "type": post_type,
-        "has_content": bool(content),
-        "timestamp": timestamp,
-        "created_at": format_timestamp(timestamp),
-    }
-    if content:
-        post_props["content"] = content
-        urls = extract_urls_from_text(content)
-        if urls:
-            post_props["extracted_urls"] = urls
-    if original_post_urn:
-        post_props["original_post_urn"] = original_post_urn
+        original_post_urn = _intern(
+            _nested_get(activity, "responseContext", "parent")
+            or _nested_get(activity, "responseContext", "root")
+        )
+
+    # create_post_node keeps the first properties seen for a URN, so only
+    # build them (and scan the content for URLs) for posts not yet recorded.
+    if post_urn not in posts:
+        post_props = {
+            "type": post_type,
+            "has_content": bool(content),
+            "timestamp": timestamp,
+            "created_at": created_at,
+        }
+        if content:
+            post_props["content"] = content
+            urls = extract_urls_from_text(content)
+            if urls:
+                post_props["extracted_urls"] = urls
+        if original_post_urn:
+            post_props["original_post_urn"] = original_post_urn
 
-    create_post_node(post_urn, posts, post_props)
+        create_post_node(post_urn, posts, post_props)
     create_person_node(author, people)
 
     if original_post_urn:
@@ -421,7 +475,7 @@ def process_post(
             "to": post_urn,
             "properties": {
                 "timestamp": timestamp,
-                "created_at": format_timestamp(timestamp),
+                "created_at": created_at,
             },
         }
     )
@@ -440,7 +494,7 @@ def process_comment(
     """Process a comment element and update entities/relationships."""
     resource_name = element.get("resourceName", "")
     comment_id = activity.get("id", "")
-    post_urn = activity.get("object", "")
+    post_urn = _intern(activity.get("object", ""))
     actor = extract_actor(element, activity)
     if trace is not None:
         _add_trace(trace, "activity.id", comment_id, "comment_id")
@@ -450,30 +504,31 @@ def process_comment(
         _add_trace(
             trace,
             "activity.message.text",
-            activity.get("message", {}).get("text", "")[:100],
+            (_nested_get(activity, "message", "text") or "")[:100],
             "comment_text",
         )
 
     if not comment_id:
-        skipped_by_reason[f"comment_no_id_{resource_name}"] += 1
+        skipped_by_reason[("comment_no_id", resource_name)] += 1
         return
     if not post_urn:
-        skipped_by_reason[f"comment_no_post_urn_{resource_name}"] += 1
+        skipped_by_reason[("comment_no_post_urn", resource_name)] += 1
         return
     if not actor:
-        skipped_by_reason[f"comment_no_actor_{resource_name}"] += 1
+        skipped_by_reason[("comment_no_actor", resource_name)] += 1
         return
 
     timestamp = _get_activity_timestamp(element, activity)
-    comment_text = activity.get("message", {}).get("text", "")
+    created_at = format_timestamp(timestamp)
+    comment_text = _nested_get(activity, "message", "text") or ""
 
     # Build correct comment URN format: urn:li:comment:(parent_type:parent_id,comment_id)
     comment_urn = build_comment_urn(post_urn, comment_id)
     if not comment_urn:
-        skipped_by_reason[f"comment_invalid_urn_{resource_name}"] += 1
+        skipped_by_reason[("comment_invalid_urn", resource_name)] += 1
         return
 
-    response_context = activity.get("responseContext", {})
+    response_context = activity.get("responseContext")
     parent_comment_urn = _extract_parent_comment_urn(
         activity, response_context, post_urn
     )
@@ -487,7 +542,7 @@ def process_comment(
             "comment_id": comment_id,
             "text": comment_text or "",
             "timestamp": timestamp,
-            "created_at": format_timestamp(timestamp),
+            "created_at": created_at,
             "url": comment_url,
         }
         if comment_text:
@@ -526,7 +581,7 @@ def process_comment(
             "to": comment_urn,
             "properties": {
                 "timestamp": timestamp,
-                "created_at": format_timestamp(timestamp),
+                "created_at": created_at,
             },
         }
     )
@@ -539,7 +594,7 @@ def process_comment(
             "to": target_urn,
             "properties": {
                 "timestamp": timestamp,
-                "created_at": format_timestamp(timestamp),
+                "created_at": created_at,
             },
         }
     )
@@ -556,7 +611,7 @@ def process_instant_repost(
 ):
     """Process an instant repost element and update entities/relationships."""
     resource_name = element.get("resourceName", "")
-    reposted_share = activity.get("repostedContent", {}).get("share", "")
+    reposted_share = _intern(_nested_get(activity, "repostedContent", "share") or "")
     actor = extract_actor(element, activity)
     if trace is not None:
         _add_trace(
@@ -566,15 +621,15 @@ def process_instant_repost(
         _add_trace(
             trace,
             "activity.created.time",
-            activity.get("created", {}).get("time"),
+            _nested_get(activity, "created", "time"),
             "timestamp",
         )
 
     if not reposted_share:
-        skipped_by_reason[f"instant_repost_no_share_{resource_name}"] += 1
+        skipped_by_reason[("instant_repost_no_share", resource_name)] += 1
         return
     if not actor:
-        skipped_by_reason[f"instant_repost_no_author_{resource_name}"] += 1
+        skipped_by_reason[("instant_repost_no_author", resource_name)] += 1
         return
 
     timestamp = _get_activity_timestamp(element, activity)
@@ -607,23 +662,22 @@ def extract_entities_and_relationships(elements):
     posts: dict[str, Any] = {}
     comments: dict[str, Any] = {}
     relationships: list[dict[str, Any]] = []
-    skipped_by_reason: dict[str, int] = defaultdict(int)
+    # Keyed by (reason, resource_name); joined into a label only when printed.
+    skipped_by_reason: dict[tuple[str, str], int] = defaultdict(int)
 
     resource_counts, method_counts, resource_examples = summarize_resources(elements)
 
     print(f"\n🔍 Processing {len(elements)} elements...")
 
     for element in elements:
-        resource_name = element.get("resourceName", "")
+        kind = _classify_resource(element.get("resourceName", ""))
         activity = element.get("activity", {})
 
-        if RESOURCE_REACTIONS in resource_name:
+        if kind == RESOURCE_REACTIONS:
             process_reaction(
                 element, activity, people, posts, relationships, skipped_by_reason
             )
-        elif (
-            RESOURCE_POST in resource_name.lower() or RESOURCE_POSTS in resource_name
-        ) and _is_comment_like_activity(activity):
+        elif kind == RESOURCE_POSTS and _is_comment_like_activity(activity):
             process_comment(
                 element,
                 activity,
@@ -633,11 +687,11 @@ def extract_entities_and_relationships(elements):
                 relationships,
                 skipped_by_reason,
             )
-        elif RESOURCE_POST in resource_name.lower() or RESOURCE_POSTS in resource_name:
+        elif kind == RESOURCE_POSTS:
             process_post(
                 element, activity, people, posts, relationships, skipped_by_reason
             )
-        elif RESOURCE_COMMENTS in resource_name:
+        elif kind == RESOURCE_COMMENTS:
             process_comment(
                 element,
                 activity,
@@ -647,22 +701,19 @@ def extract_entities_and_relationships(elements):
                 relationships,
                 skipped_by_reason,
             )
-        elif RESOURCE_INSTANT_REPOSTS in resource_name:
+        elif kind == RESOURCE_INSTANT_REPOSTS:
             process_instant_repost(
                 element, activity, people, posts, relationships, skipped_by_reason
             )
 
-    nodes: list[Any] = []
-    nodes.extend(people.values())
-    nodes.extend(posts.values())
-    nodes.extend(comments.values())
+    nodes = list(chain(people.values(), posts.values(), comments.values()))
 
     print(f"\n📊 Processing summary:")
     print_resource_summary(resource_counts, method_counts, resource_examples, top_n=10)
     if skipped_by_reason:
         print(f"   Skipped elements:")
-        for reason, count in sorted(skipped_by_reason.items()):
-            print(f"     • {reason}: {count}")
+        for (reason, resource_name), count in sorted(skipped_by_reason.items()):
+            print(f"     • {reason}_{resource_name}: {count}")
     print(f"\n📦 Extracted entities:")
     print(f"   People: {len(people)}")
     print(f"   Posts: {len(posts)}")
@@ -708,6 +759,16 @@ def print_summary(data):
     print("\n" + "=" * 60)
 
 
+def _write_json_items(f, items):
+    """Write items as comma-separated JSON values to a binary file."""
+    first = True
+    for item in items:
+        if not first:
+            f.write(b",\n")
+        f.write(orjson.dumps(item, option=orjson.OPT_INDENT_2))
+        first = False
+
+
 def save_neo4j_data(data, filename="neo4j_data.json"):
     """Save Neo4j-ready data to JSON file with timestamp to avoid overwriting."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -715,29 +776,38 @@ def save_neo4j_data(data, filename="neo4j_data.json"):
     filename = f"{base_name}_{timestamp}{ext}"
     filepath = OUTPUT_DIR / filename
 
-    neo4j_format = {
-        "nodes": [
-            {
-                "id": node["id"],
-                "labels": [node["label"]],
-                "properties": node["properties"],
-            }
-            for node in data["nodes"]
-        ],
-        "relationships": [
-            {
-                "type": rel["type"],
-                "startNode": rel["from"],
-                "endNode": rel["to"],
-                "properties": rel["properties"],
-            }
-            for rel in data["relationships"]
-        ],
-        "statistics": data["statistics"],
-    }
-
-    with open(filepath, "w") as f:
-        json.dump(neo4j_format, f, indent=2)
+    # Stream records one by one so the reshaped graph never exists in memory
+    # as a whole; the result is still a single JSON document. A large write
+    # buffer batches the many small per-record writes into few syscalls.
+    with open(filepath, "wb", buffering=SAVE_BUFFER_SIZE) as f:
+        f.write(b'{"nodes": [\n')
+        _write_json_items(
+            f,
+            (
+                {
+                    "id": node["id"],
+                    "labels": [node["label"]],
+                    "properties": node["properties"],
+                }
+                for node in data["nodes"]
+            ),
+        )
+        f.write(b'\n], "relationships": [\n')
+        _write_json_items(
+            f,
+            (
+                {
+                    "type": rel["type"],
+                    "startNode": rel["from"],
+                    "endNode": rel["to"],
+                    "properties": rel["properties"],
+                }
+                for rel in data["relationships"]
+            ),
+        )
+        f.write(b'\n], "statistics": ')
+        f.write(orjson.dumps(data["statistics"], option=orjson.OPT_INDENT_2))
+        f.write(b"}\n")
 
     print(f"💾 Neo4j data saved to {filepath}")
 
@@ -812,15 +882,13 @@ def _post_to_record(
 ) -> Optional[ActivityRecord]:
     """Convert a post element to an ActivityRecord."""
     post_urn = activity.get("id", "")
-    if not post_urn or not (
-        post_urn.startswith("urn:li:share:") or post_urn.startswith("urn:li:ugcPost:")
-    ):
+    if not post_urn or not post_urn.startswith(POST_URN_PREFIXES):
         return None
 
     timestamp = _get_activity_timestamp(element, activity)
     actor = extract_actor(element, activity)
     is_repost = activity.get("ugcOrigin") == "RESHARE" or bool(
-        activity.get("responseContext", {}).get("parent")
+        _nested_get(activity, "responseContext", "parent")
     )
 
     if is_repost:
@@ -828,20 +896,19 @@ def _post_to_record(
     else:
         author = (
             activity.get("author")
-            or activity.get("firstPublishedActor", {}).get("member", "")
+            or _nested_get(activity, "firstPublishedActor", "member")
             or actor
         )
 
-    share_content = activity.get("specificContent", {}).get(
-        "com.linkedin.ugc.ShareContent", {}
-    )
-    content = share_content.get("shareCommentary", {}).get("text", "")
+    content = _share_commentary_text(activity) or ""
     original_post_urn = ""
 
     if is_repost:
-        original_post_urn = activity.get("responseContext", {}).get(
-            "parent"
-        ) or activity.get("responseContext", {}).get("root", "")
+        original_post_urn = (
+            _nested_get(activity, "responseContext", "parent")
+            or _nested_get(activity, "responseContext", "root")
+            or ""
+        )
         activity_type = ActivityType.REPOST.value
         post_id = extract_urn_id(original_post_urn) or ""
     else:
@@ -877,12 +944,12 @@ def _comment_to_record(
         return None
 
     timestamp = _get_activity_timestamp(element, activity)
-    comment_text = activity.get("message", {}).get("text", "")
+    comment_text = _nested_get(activity, "message", "text") or ""
     comment_urn = build_comment_urn(post_urn, comment_id)
     if not comment_urn:
         return None
 
-    response_context = activity.get("responseContext", {})
+    response_context = activity.get("responseContext")
     parent_comment_urn = _extract_parent_comment_urn(
         activity, response_context, post_urn
     )
@@ -912,7 +979,7 @@ def _instant_repost_to_record(
     element: dict, activity: dict, owner: str = ""
 ) -> Optional[ActivityRecord]:
     """Convert an instant repost element to an ActivityRecord."""
-    reposted_share = activity.get("repostedContent", {}).get("share", "")
+    reposted_share = _nested_get(activity, "repostedContent", "share") or ""
     actor = extract_actor(element, activity)
     if not reposted_share or not actor:
         return None
@@ -948,21 +1015,19 @@ def extract_activity_records(elements: list, owner: str = "") -> List[ActivityRe
     """
     records: List[ActivityRecord] = []
     for element in elements:
-        resource_name = element.get("resourceName", "")
+        kind = _classify_resource(element.get("resourceName", ""))
         activity = element.get("activity", {})
         record: Optional[ActivityRecord] = None
 
-        if RESOURCE_REACTIONS in resource_name:
+        if kind == RESOURCE_REACTIONS:
             record = _reaction_to_record(element, activity, owner)
-        elif (
-            RESOURCE_POST in resource_name.lower() or RESOURCE_POSTS in resource_name
-        ) and _is_comment_like_activity(activity):
+        elif kind == RESOURCE_POSTS and _is_comment_like_activity(activity):
             record = _comment_to_record(element, activity, owner)
-        elif RESOURCE_POST in resource_name.lower() or RESOURCE_POSTS in resource_name:
+        elif kind == RESOURCE_POSTS:
             record = _post_to_record(element, activity, owner)
-        elif RESOURCE_COMMENTS in resource_name:
+        elif kind == RESOURCE_COMMENTS:
             record = _comment_to_record(element, activity, owner)
-        elif RESOURCE_INSTANT_REPOSTS in resource_name:
+        elif kind == RESOURCE_INSTANT_REPOSTS:
             record = _instant_repost_to_record(element, activity, owner)
 
         if record is not None:
@@ -1207,7 +1272,7 @@ def records_to_neo4j_json(records: List[ActivityRecord]) -> dict:
                 }
             )
 
-    nodes = list(people.values()) + list(posts.values()) + list(comments.values())
+    nodes = list(chain(people.values(), posts.values(), comments.values()))
 
     return {
         "nodes": nodes,
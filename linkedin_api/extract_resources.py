@@ -9,17 +9,36 @@ Extracts URLs from:
 Creates Resource nodes with REFERENCES relationships to posts and comments.
 """
 
+import hashlib
+import logging
 import os
 import re
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from neo4j import GraphDatabase
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+from linkedin_api.activity_csv import get_data_dir
+from linkedin_api.utils.urls import (
+    URL_RE,
+    extract_urls_from_text,
+    is_comment_feed_url,
+    url_host_and_path,
+)
 
-from linkedin_api.utils.urls import extract_urls_from_text, is_comment_feed_url
 
+logger = logging.getLogger(__name__)
 
 # When set (1, true, yes), use only content from API/Neo4j; never read LinkedIn post URLs.
 USE_API_CONTENT_ONLY = os.getenv("USE_API_CONTENT_ONLY", "").lower() in (
@@ -28,6 +47,210 @@ USE_API_CONTENT_ONLY = os.getenv("USE_API_CONTENT_ONLY", "").lower() in (
     "yes",
 )
 
+# Rows per UNWIND transaction when writing Resource nodes
+RESOURCE_BATCH_SIZE = 1000
+
+# Threads used to resolve redirects and fetch titles concurrently
+URL_FETCH_WORKERS = 16
+
+# Resource types worth an extra request to fetch the page title; files, media
+# and social posts rarely have a useful one
+TITLE_RESOURCE_TYPES = frozenset({"article", "research", "repository", "documentation"})
+
+# Enriched URLs persisted across runs under get_data_dir(). Rows older than
+# URL_CACHE_MAX_AGE are enriched again, since redirect targets and titles change.
+URL_CACHE_FILENAME = "resource_url_cache.json"
+URL_CACHE_MAX_AGE = timedelta(days=30)
+# Bump when the cached row format changes; edits to the classification tables
+# invalidate the cache on their own (see _url_cache_version)
+URL_CACHE_SCHEMA = 1
+
+# Hosts whose links are already canonical (no redirect to follow) and whose
+# type (video, social) is not in TITLE_RESOURCE_TYPES: enriched without HTTP
+CANONICAL_HOSTS = frozenset(
+    {"youtube.com", "vimeo.com", "twitter.com", "x.com", "instagram.com"}
+)
+
+# Bytes of a page read by extract_title_from_url; enough for any <head>
+TITLE_MAX_BYTES = 64 * 1024
+
+# Target of a <meta http-equiv="refresh" content="0;url=https://..."> tag
+_META_URL_RE = re.compile(r"url=(https?://[^\s]+)", re.IGNORECASE)
+
+# Browser-like headers sent with every outgoing request (avoids being blocked)
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+
+def build_http_session() -> requests.Session:
+    """Return a requests.Session with keep-alive connections and retries.
+
+    Sessions are per thread (see _http_session), so the adapter keeps the
+    default pool sizes rather than one sized for every worker.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        max_retries=Retry(
+            total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+# One session per thread: URL probes run on a thread pool and requests.Session
+# is not thread-safe, but each worker still reuses its connections across URLs
+_thread_local = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """Return the calling thread's HTTP session, creating it on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = build_http_session()
+    return session
+
+
+def _register_worker_session(sessions: List[requests.Session]) -> None:
+    """Thread pool initializer: open the worker's session and record it for closing."""
+    sessions.append(_http_session())
+
+
+# Indexes backing the MATCH/MERGE lookups of the Resource batch writers. Plain
+# indexes rather than a uniqueness constraint, which would fail to create on a
+# graph that already holds duplicate Resource URLs.
+RESOURCE_INDEX_QUERIES = (
+    "CREATE INDEX post_urn IF NOT EXISTS FOR (n:Post) ON (n.urn)",
+    "CREATE INDEX comment_urn IF NOT EXISTS FOR (n:Comment) ON (n.urn)",
+    "CREATE INDEX resource_url IF NOT EXISTS FOR (n:Resource) ON (n.url)",
+)
+
+# LinkedIn URLs that never become Resource nodes (see should_ignore_url)
+IGNORED_URL_SUBSTRINGS = (
+    # Profile links (already handled via Person nodes)
+    "linkedin.com/in/",
+    "linkedin.com/pub/",
+    # Hashtag pages
+    "linkedin.com/feed/hashtag/",
+    # Company pages (could be handled separately if needed)
+    "linkedin.com/company/",
+)
+
+# One pass over the URL for all ignore rules: internal LinkedIn navigation
+# links (including feed update URLs) plus IGNORED_URL_SUBSTRINGS anywhere
+_IGNORE_RE = re.compile(
+    r"^https://www\.linkedin\.com/feed/|"
+    + "|".join(re.escape(pattern) for pattern in IGNORED_URL_SUBSTRINGS)
+)
+
+# -- URL categorization tables (checked in order by categorize_url) --------
+
+# Resource type by file extension of the URL path
+FILE_EXTENSION_TYPES = {
+    # Documents
+    ".pdf": "document",
+    ".doc": "document",
+    ".docx": "document",
+    ".ppt": "presentation",
+    ".pptx": "presentation",
+    ".xls": "spreadsheet",
+    ".xlsx": "spreadsheet",
+    # Images
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".gif": "image",
+    ".svg": "image",
+    ".webp": "image",
+    # Videos
+    ".mp4": "video",
+    ".avi": "video",
+    ".mov": "video",
+    ".webm": "video",
+    ".mkv": "video",
+    # Audio
+    ".mp3": "audio",
+    ".wav": "audio",
+    ".ogg": "audio",
+    # Archives
+    ".zip": "archive",
+    ".tar": "archive",
+    ".gz": "archive",
+}
+
+# Domain substrings per resource type
+VIDEO_DOMAINS = (
+    "youtube.com",
+    "youtu.be",
+    "vimeo.com",
+    "dailymotion.com",
+    "twitch.tv",
+)
+REPOSITORY_DOMAINS = ("github.com", "gitlab.com", "bitbucket.org", "sourceforge.net")
+DOCUMENTATION_DOMAINS = ("docs.", "documentation", "readthedocs.io", "gitbook.io")
+SOCIAL_DOMAINS = (
+    "twitter.com",
+    "x.com",
+    "facebook.com",
+    "instagram.com",
+    "tiktok.com",
+)
+ARTICLE_DOMAINS = (
+    "medium.com",
+    "substack.com",
+    "dev.to",
+    "hashnode.com",
+    "blog.",
+    "news.",
+    "article",
+)
+ARTICLE_PATHS = ("/blog/", "/article/", "/post/")
+RESEARCH_DOMAINS = (
+    "arxiv.org",
+    "scholar.google.com",
+    "researchgate.net",
+    "academia.edu",
+    "doi.org",
+)
+PRODUCT_DOMAINS = ("amazon.com", "shopify.com", "etsy.com", "ebay.com")
+TOOL_DOMAINS = (
+    "stackoverflow.com",
+    "reddit.com",
+    "discord.com",
+    "slack.com",
+    "notion.so",
+    "figma.com",
+)
+PODCAST_DOMAINS = ("spotify.com", "podcast", "anchor.fm", "podbean.com")
+
+# Domain-based types in precedence order; the first matching rule wins.
+# See _domain_matches for how full domains and fragments are compared.
+DOMAIN_TYPE_RULES = (
+    ("video", VIDEO_DOMAINS),
+    ("repository", REPOSITORY_DOMAINS),
+    ("documentation", DOCUMENTATION_DOMAINS),
+    # Social media (treat as external content)
+    ("social", SOCIAL_DOMAINS),
+    ("article", ARTICLE_DOMAINS),
+    ("research", RESEARCH_DOMAINS),
+    ("product", PRODUCT_DOMAINS),
+    ("tool", TOOL_DOMAINS),
+    ("podcast", PODCAST_DOMAINS),
+)
+# Domain types that take precedence over ARTICLE_PATHS
+TYPES_BEFORE_ARTICLE_PATHS = frozenset(
+    {"video", "repository", "documentation", "social", "article"}
+)
+
 
 def fetch_post_content_from_url(url: str) -> Optional[str]:
     """
@@ -40,10 +263,11 @@ def fetch_post_content_from_url(url: str) -> Optional[str]:
         Extracted text content or None if extraction fails
     """
     try:
-        response = requests.get(url, timeout=10, allow_redirects=True)
+        response = _http_session().get(url, timeout=10, allow_redirects=True)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Raw bytes let lxml detect the page encoding itself
+        soup = BeautifulSoup(response.content, "lxml")
 
         # Try to find post content - LinkedIn uses various selectors
         content_selectors = [
@@ -86,6 +310,45 @@ def fetch_post_content_from_url(url: str) -> Optional[str]:
         return None
 
 
+def _domain_matches(domain: str, pattern: str) -> bool:
+    """
+    Match a domain against a DOMAIN_TYPE_RULES entry.
+
+    Full domains ("x.com") match the domain itself or its subdomains, never a
+    longer name that merely contains them ("netflix.com"). Fragments such as
+    "docs." or "podcast" still match anywhere in the domain.
+    """
+    if pattern.endswith(".") or "." not in pattern:
+        return pattern in domain
+    return domain == pattern or domain.endswith("." + pattern)
+
+
+def _scan_domain_rules(domain: str) -> Optional[str]:
+    """Walk DOMAIN_TYPE_RULES in order and return the first matching type."""
+    for resource_type, domains in DOMAIN_TYPE_RULES:
+        if any(_domain_matches(domain, d) for d in domains):
+            return resource_type
+    return None
+
+
+# Well-known domains listed in DOMAIN_TYPE_RULES, resolved once so the common
+# case is a single dict hit. Built through the rule walk to keep its precedence.
+_EXACT_DOMAIN_TYPES = {
+    d: _scan_domain_rules(d)
+    for _, domains in DOMAIN_TYPE_RULES
+    for d in domains
+    if "." in d.strip(".")
+}
+
+
+@lru_cache(maxsize=8192)
+def _domain_type(domain: str) -> Optional[str]:
+    """Return the resource type implied by the domain alone, if any."""
+    if domain in _EXACT_DOMAIN_TYPES:
+        return _EXACT_DOMAIN_TYPES[domain]
+    return _scan_domain_rules(domain)
+
+
 def categorize_url(url: str) -> Dict[str, Optional[str]]:
     """
     Categorize a URL by domain and type.
@@ -97,158 +360,26 @@ def categorize_url(url: str) -> Dict[str, Optional[str]]:
         Dict with 'domain', 'type', and optionally 'title'
     """
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        path = parsed.path.lower()
+        domain, path = url_host_and_path(url)
 
         # Remove 'www.' prefix for cleaner domain names
         if domain.startswith("www."):
             domain = domain[4:]
 
-        # First, check file extensions in URL path
-        url_lower = url.lower()
-        file_extensions = {
-            # Documents
-            ".pdf": "document",
-            ".doc": "document",
-            ".docx": "document",
-            ".ppt": "presentation",
-            ".pptx": "presentation",
-            ".xls": "spreadsheet",
-            ".xlsx": "spreadsheet",
-            # Images
-            ".jpg": "image",
-            ".jpeg": "image",
-            ".png": "image",
-            ".gif": "image",
-            ".svg": "image",
-            ".webp": "image",
-            # Videos
-            ".mp4": "video",
-            ".avi": "video",
-            ".mov": "video",
-            ".webm": "video",
-            ".mkv": "video",
-            # Audio
-            ".mp3": "audio",
-            ".wav": "audio",
-            ".ogg": "audio",
-            # Archives
-            ".zip": "archive",
-            ".tar": "archive",
-            ".gz": "archive",
-        }
+        # First, check the file extension of the URL path (not the query)
+        ext_type = FILE_EXTENSION_TYPES.get(os.path.splitext(path)[1].lower())
+        if ext_type:
+            return {"domain": domain, "type": ext_type}
 
-        for ext, resource_type in file_extensions.items():
-            if ext in url_lower:
-                return {"domain": domain, "type": resource_type}
-
-        # Determine resource type based on domain and path patterns
-        resource_type = None  # type: ignore[assignment]
-
-        # Video platforms
-        if any(
-            video_domain in domain
-            for video_domain in [
-                "youtube.com",
-                "youtu.be",
-                "vimeo.com",
-                "dailymotion.com",
-                "twitch.tv",
-            ]
-        ):
-            resource_type = "video"
-        # Code repositories
-        elif any(
-            repo_domain in domain
-            for repo_domain in [
-                "github.com",
-                "gitlab.com",
-                "bitbucket.org",
-                "sourceforge.net",
-            ]
-        ):
-            resource_type = "repository"
-        # Documentation sites
-        elif any(
-            doc_domain in domain
-            for doc_domain in ["docs.", "documentation", "readthedocs.io", "gitbook.io"]
-        ):
-            resource_type = "documentation"
-        # Social media (treat as external content)
-        elif any(
-            social_domain in domain
-            for social_domain in [
-                "twitter.com",
-                "x.com",
-                "facebook.com",
-                "instagram.com",
-                "tiktok.com",
-            ]
-        ):
-            resource_type = "social"
-        # News and articles
-        elif (
-            any(
-                article_domain in domain
-                for article_domain in [
-                    "medium.com",
-                    "substack.com",
-                    "dev.to",
-                    "hashnode.com",
-                    "blog.",
-                    "news.",
-                    "article",
-                ]
-            )
-            or "/blog/" in path
-            or "/article/" in path
-            or "/post/" in path
+        # Determine resource type based on domain, then path patterns
+        resource_type = _domain_type(domain)
+        if resource_type not in TYPES_BEFORE_ARTICLE_PATHS and any(
+            p in path for p in ARTICLE_PATHS
         ):
             resource_type = "article"
-        # Academic/research
-        elif any(
-            academic_domain in domain
-            for academic_domain in [
-                "arxiv.org",
-                "scholar.google.com",
-                "researchgate.net",
-                "academia.edu",
-                "doi.org",
-            ]
-        ):
-            resource_type = "research"
-        # E-commerce
-        elif any(
-            shop_domain in domain
-            for shop_domain in ["amazon.com", "shopify.com", "etsy.com", "ebay.com"]
-        ):
-            resource_type = "product"
-        # Tools/platforms
-        elif any(
-            tool_domain in domain
-            for tool_domain in [
-                "stackoverflow.com",
-                "reddit.com",
-                "discord.com",
-                "slack.com",
-                "notion.so",
-                "figma.com",
-            ]
-        ):
-            resource_type = "tool"
-        # Podcasts
-        elif any(
-            podcast_domain in domain
-            for podcast_domain in ["spotify.com", "podcast", "anchor.fm", "podbean.com"]
-        ):
-            resource_type = "podcast"
-        # LinkedIn articles (treat as external)
-        elif "linkedin.com" in domain and "/pulse/" in url:
-            resource_type = "article"
 
-        # Default to "article" if no specific type found
-        # This is reasonable since most web URLs are articles/blog posts
+        # Default to "article" if no specific type found (this also covers
+        # LinkedIn /pulse/ articles); most web URLs are articles/blog posts
         if resource_type is None:
             resource_type = "article"
 
@@ -264,6 +395,9 @@ def resolve_redirect(url: str, max_redirects: int = 5) -> str:
     """
     Resolve redirects to get the final URL.
 
+    Cached per URL for the lifetime of the process, since popular short links
+    and articles are shared by many posts and comments.
+
     Handles LinkedIn short URLs (lnkd.in) which use an intermediate page.
     For LinkedIn URLs, parses the HTML to extract the final destination.
 
@@ -274,41 +408,47 @@ def resolve_redirect(url: str, max_redirects: int = 5) -> str:
     Returns:
         Final URL after following redirects, or original URL if resolution fails
     """
-    # Use User-Agent to avoid being blocked
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
+    return _try_resolve_redirect(url) or url
+
+
+@lru_cache(maxsize=4096)
+def _try_resolve_redirect(url: str) -> Optional[str]:
+    """
+    Body of ``resolve_redirect``, telling failures apart from non-redirects.
 
+    Returns:
+        Final URL (the original one if it does not redirect), or None if
+        every request failed (timeout, DNS or connection error)
+    """
     # Special handling for LinkedIn short URLs
     if "lnkd.in" in url:
         try:
             # LinkedIn short URLs require GET request and HTML parsing
-            response = requests.get(
+            response = _http_session().get(
                 url,
                 timeout=15,
                 allow_redirects=True,
-                headers=headers,
             )
+        except Exception:
+            return None
+        if _is_transient_status(response.status_code):
+            # Rate-limited or server error: the interstitial page is not there
+            return None
 
+        try:
             # Check if we got redirected via HTTP (some lnkd.in URLs redirect directly)
             if response.url != url and "lnkd.in" not in response.url:
                 return str(response.url)
 
             # LinkedIn shows intermediate page - parse HTML for final URL
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
 
             # Pattern 1: Look for meta tags with the final URL
             meta_refresh = soup.find("meta", attrs={"http-equiv": "refresh"})
             if meta_refresh and meta_refresh.get("content"):
                 content = str(meta_refresh["content"])
                 # Extract URL from refresh meta tag: "0;url=https://..."
-                url_match = re.search(r"url=(https?://[^\s]+)", content, re.IGNORECASE)
+                url_match = _META_URL_RE.search(content)
                 if url_match:
                     return url_match.group(1)
 
@@ -317,16 +457,11 @@ def resolve_redirect(url: str, max_redirects: int = 5) -> str:
             page_text = response.text
 
             # Look for URLs that are not LinkedIn domains
-            # Simple pattern that matches any http/https URL
-            simple_pattern = (
-                r"https?://[^\s<>\"'{}|\\^`\[\]]+[^\s<>\"'{}|\\^`\[\].,;:!?]"
-            )
-            all_urls = re.findall(simple_pattern, page_text)
+            all_urls = URL_RE.findall(page_text)
 
             # Filter out LinkedIn URLs and static assets, prioritize content URLs
             external_urls = []
             for found_url in all_urls:
-                found_url = found_url.rstrip(".,;:!?)")
                 url_lower = found_url.lower()
 
                 # Skip LinkedIn domains
@@ -380,13 +515,14 @@ def resolve_redirect(url: str, max_redirects: int = 5) -> str:
 
     # For non-LinkedIn URLs, try standard redirect resolution
     # Try HEAD first (faster)
+    reached = False
     try:
-        response = requests.head(
+        response = _http_session().head(
             url,
             timeout=15,
             allow_redirects=True,
-            headers=headers,
         )
+        reached = True
         final_url = str(response.url)
         if final_url != url:
             return final_url
@@ -395,27 +531,73 @@ def resolve_redirect(url: str, max_redirects: int = 5) -> str:
 
     # If HEAD fails or returns same URL, try GET (some servers don't support HEAD)
     try:
-        response = requests.get(
+        response = _http_session().get(
             url,
             timeout=15,
             allow_redirects=True,
             stream=True,
-            headers=headers,
         )
+        reached = True
         final_url = str(response.url)
         if final_url != url:
             return final_url
     except Exception:
         pass
 
-    # If both fail, return original URL
-    return url
+    # No redirect if the server answered; a failed lookup if it never did
+    return url if reached else None
+
 
+def _is_transient_status(status_code: object) -> bool:
+    """True for HTTP statuses worth retrying on a later run (rate limits, server errors)."""
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+def _read_html_head(response: requests.Response) -> Optional[bytes]:
+    """Return the start of a successful HTML response body, or None."""
+    response.raise_for_status()
+
+    # Check content type
+    content_type = response.headers.get("content-type", "").lower()
+    if "text/html" not in content_type:
+        return None
 
+    # The title lives in <head>: only download the start of the page
+    return response.raw.read(TITLE_MAX_BYTES, decode_content=True)
+
+
+def _title_from_html(head: bytes) -> Optional[str]:
+    """Return the <title>, og:title or twitter:title of an HTML page head."""
+    # Only <title> and <meta> are needed, so skip building the rest of the tree
+    soup = BeautifulSoup(head, "lxml", parse_only=SoupStrainer(["title", "meta"]))
+
+    # Try <title> tag first
+    title_tag = soup.find("title")
+    if title_tag:
+        title = title_tag.get_text(strip=True)
+        if title:
+            return title
+
+    # Try Open Graph title
+    og_title = soup.find("meta", property="og:title")
+    if og_title and og_title.get("content"):
+        return str(og_title["content"]).strip()
+
+    # Try Twitter Card title
+    twitter_title = soup.find("meta", attrs={"name": "twitter:title"})
+    if twitter_title and twitter_title.get("content"):
+        return str(twitter_title["content"]).strip()
+
+    return None
+
+
+@lru_cache(maxsize=4096)
 def extract_title_from_url(url: str) -> Optional[str]:
     """
     Extract title from a URL by fetching the page and parsing HTML.
 
+    Cached per URL for the lifetime of the process.
+
     Args:
         url: URL to extract title from
 
@@ -423,36 +605,61 @@ def extract_title_from_url(url: str) -> Optional[str]:
         Title string or None if extraction fails
     """
     try:
-        response = requests.get(url, timeout=10, allow_redirects=True)
-        response.raise_for_status()
+        response = _http_session().get(
+            url, timeout=10, allow_redirects=True, stream=True
+        )
+        try:
+            head = _read_html_head(response)
+        finally:
+            response.close()
+        return _title_from_html(head) if head else None
+    except Exception:
+        return None
 
-        # Check content type
-        content_type = response.headers.get("content-type", "").lower()
-        if "text/html" not in content_type:
-            return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
+@lru_cache(maxsize=4096)
+def fetch_final_url_and_title(url: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Follow redirects and read the page title with a single GET.
 
-        # Try <title> tag first
-        title_tag = soup.find("title")
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-            if title:
-                return title
+    Replaces a ``resolve_redirect`` + ``extract_title_from_url`` pair for
+    ordinary URLs (lnkd.in short links still need ``resolve_redirect``).
+    Cached per URL for the lifetime of the process.
 
-        # Try Open Graph title
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return str(og_title["content"]).strip()
+    Args:
+        url: URL to fetch
 
-        # Try Twitter Card title
-        twitter_title = soup.find("meta", attrs={"name": "twitter:title"})
-        if twitter_title and twitter_title.get("content"):
-            return str(twitter_title["content"]).strip()
+    Returns:
+        Tuple of (final URL, title or None), or None if the request failed
+        (timeout, DNS or connection error, rate limit or server error) so the
+        URL can be retried later
+    """
+    try:
+        response = _http_session().get(
+            url, timeout=15, allow_redirects=True, stream=True
+        )
+    except Exception:
+        return None
 
+    final_url, title = url, None
+    try:
+        final_url = str(response.url)
+        head = _read_html_head(response)
+        if head:
+            title = _title_from_html(head)
+    except (ProtocolError, ReadTimeoutError):
+        # Connection dropped while reading the page: a failure, not a title-less page
         return None
+    except requests.HTTPError as e:
+        # 429/5xx say nothing about the page; other errors (404...) are final
+        if e.response is not None and _is_transient_status(e.response.status_code):
+            return None
     except Exception:
-        return None
+        # Keep the resolved URL even when the page itself is unusable
+        pass
+    finally:
+        response.close()
+    return final_url, title
 
 
 def should_ignore_url(url: str) -> bool:
@@ -465,23 +672,27 @@ def should_ignore_url(url: str) -> bool:
     Returns:
         True if URL should be ignored
     """
-    # LinkedIn profile links (already handled via Person nodes)
-    if "linkedin.com/in/" in url or "linkedin.com/pub/" in url:
-        return True
+    # Every ignore rule is a LinkedIn URL; external links skip the regex
+    if "linkedin.com" not in url:
+        return False
+    return _IGNORE_RE.search(url) is not None
 
-    # Hashtag links (LinkedIn hashtag pages)
-    if "linkedin.com/feed/hashtag/" in url:
-        return True
 
-    # LinkedIn company pages (could be handled separately if needed)
-    if "linkedin.com/company/" in url:
-        return True
+def classify_url(url: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Categorize a URL, or return None if it should be ignored.
+
+    Combines ``should_ignore_url`` and ``categorize_url``.
 
-    # Internal LinkedIn navigation links (including feed update URLs)
-    if url.startswith("https://www.linkedin.com/feed/"):
-        return True
+    Args:
+        url: URL to classify
 
-    return False
+    Returns:
+        None if the URL is ignored, else the ``categorize_url`` dict
+    """
+    if should_ignore_url(url):
+        return None
+    return categorize_url(url)
 
 
 def get_posts_with_content(
@@ -504,11 +715,12 @@ def get_posts_with_content(
     RETURN post.urn as urn, post.content as text, post.url as url
     """
 
+    # A parameter rather than a literal keeps one cached plan for any limit
     if limit:
-        query += f" LIMIT {limit}"
+        query += " LIMIT $limit"
 
     with driver.session(database=database) as session:
-        result = session.run(query)
+        result = session.run(query, limit=limit)
         return [
             {
                 "urn": record["urn"],
@@ -519,18 +731,21 @@ def get_posts_with_content(
         ]
 
 
-def get_comments_with_text(
+def iter_comments_with_text(
     driver, limit: Optional[int] = None, database: str = "neo4j"
-) -> List[Dict[str, str]]:
+) -> Iterator[Dict[str, str]]:
     """
-    Fetch Comment nodes that have text content.
+    Stream Comment nodes that have text content.
+
+    Records are yielded as the driver receives them, so the session stays open
+    until the generator is exhausted; keep per-record work short.
 
     Args:
         driver: Neo4j driver
         limit: Optional limit on number of comments to fetch
 
-    Returns:
-        List of dicts with comment URN and text
+    Yields:
+        Dicts with comment URN and text
     """
     query = """
     MATCH (comment:Comment)
@@ -539,12 +754,30 @@ def get_comments_with_text(
     RETURN comment.urn as urn, comment.text as text
     """
 
+    # A parameter rather than a literal keeps one cached plan for any limit
     if limit:
-        query += f" LIMIT {limit}"
+        query += " LIMIT $limit"
 
     with driver.session(database=database) as session:
-        result = session.run(query)
-        return [{"urn": record["urn"], "text": record["text"]} for record in result]
+        result = session.run(query, limit=limit)
+        for record in result:
+            yield {"urn": record["urn"], "text": record["text"]}
+
+
+def get_comments_with_text(
+    driver, limit: Optional[int] = None, database: str = "neo4j"
+) -> List[Dict[str, str]]:
+    """
+    Fetch Comment nodes that have text content.
+
+    Args:
+        driver: Neo4j driver
+        limit: Optional limit on number of comments to fetch
+
+    Returns:
+        List of dicts with comment URN and text
+    """
+    return list(iter_comments_with_text(driver, limit=limit, database=database))
 
 
 def extract_resources_from_json(json_file: str) -> Dict[str, Dict[str, List[str]]]:
@@ -559,26 +792,28 @@ def extract_resources_from_json(json_file: str) -> Dict[str, Dict[str, List[str]
     Returns:
         Dict with 'posts' and 'comments' keys, each mapping URN -> list of URLs
     """
-    import json
-
     resources: Dict[str, Dict[str, List[str]]] = {"posts": {}, "comments": {}}
 
-    with open(json_file, "r") as f:
-        data = json.load(f)
+    # Only nodes carry text; keeping no reference to the parsed document lets
+    # the relationships (the bulk of the file) be freed before the node loop.
+    with open(json_file, "rb") as f:
+        nodes = orjson.loads(f.read()).get("nodes", [])
 
-    nodes = data.get("nodes", [])
+    post_resources = resources["posts"]
+    comment_resources = resources["comments"]
     for node in nodes:
-        labels = node.get("labels", [])
-        props = node.get("properties", {})
+        props = node.get("properties") or {}
         urn = props.get("urn")
 
         if not urn:
             continue
 
+        labels = node.get("labels") or ()
+
         # Extract from Post content
         if "Post" in labels:
             # Prefer extracted_urls (from full content) if available
-            urls = props.get("extracted_urls", [])
+            urls = props.get("extracted_urls")
             if not urls:
                 # Fallback 1: extract from truncated content
                 content = props.get("content", "")
@@ -594,17 +829,17 @@ def extract_resources_from_json(json_file: str) -> Dict[str, Dict[str, List[str]
                 if (not urls or is_truncated) and not USE_API_CONTENT_ONLY:
                     post_url = props.get("url", "")
                     if post_url and not is_comment_feed_url(post_url):
-                        print(f"   🔄 Fetching content from post URL: {post_url}")
+                        logger.debug("Fetching content from post URL: %s", post_url)
                         full_content = fetch_post_content_from_url(post_url)
                         if full_content:
                             urls = extract_urls_from_text(full_content)
             if urls:
-                resources["posts"][urn] = urls
+                post_resources[urn] = urls
 
         # Extract from Comment text
         elif "Comment" in labels:
             # Prefer extracted_urls (from full content) if available
-            urls = props.get("extracted_urls", [])
+            urls = props.get("extracted_urls")
             if not urls:
                 # Fallback: extract from truncated text
                 # Note: Comments don't have URLs, so we can't fetch them
@@ -612,11 +847,330 @@ def extract_resources_from_json(json_file: str) -> Dict[str, Dict[str, List[str]
                 if text:
                     urls = extract_urls_from_text(text)
             if urls:
-                resources["comments"][urn] = urls
+                comment_resources[urn] = urls
 
     return resources
 
 
+def _enrich_url(url: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Resolve, classify and fetch the title of one URL.
+
+    Safe to run from worker threads: errors are logged and reported as None
+    so one bad URL does not abort the whole batch. Network failures are
+    reported as None too, so the URL is not cached and is retried next run.
+
+    Returns:
+        Dict with url, domain, type and title, or None if ignored or failed
+    """
+    try:
+        short_link = "lnkd.in" in url
+        title: Optional[str] = None
+        if url_host_and_path(url)[0].removeprefix("www.") in CANONICAL_HOSTS:
+            # No redirect to follow and no title kept: skip the network
+            final_url = url
+        elif short_link:
+            # LinkedIn short links land on an interstitial page to parse first
+            resolved = _try_resolve_redirect(url)
+            if resolved is None:
+                return None
+            final_url = resolved
+        else:
+            # One GET follows the redirects and reads the page head for the title
+            fetched = fetch_final_url_and_title(url)
+            if fetched is None:
+                return None
+            final_url, title = fetched
+
+        # Short links can resolve to ignored LinkedIn pages (profiles, etc.)
+        url_info = classify_url(final_url)
+        if not url_info or not url_info["domain"]:
+            return None
+
+        if url_info["type"] not in TITLE_RESOURCE_TYPES:
+            title = None
+        elif short_link:
+            fetched = fetch_final_url_and_title(final_url)
+            if fetched is None:
+                return None
+            title = fetched[1]
+
+        return {
+            "url": final_url,
+            "domain": url_info["domain"],
+            "type": url_info["type"],
+            "title": title,
+        }
+    except Exception as e:
+        # Log error but continue with next URL
+        logger.debug("Error processing URL %s: %s", url, e)
+        return None
+
+
+def _url_cache_path() -> Path:
+    return get_data_dir() / URL_CACHE_FILENAME
+
+
+def _url_cache_version() -> str:
+    """Cache format plus a digest of the rules that shaped the cached rows."""
+    rules = (
+        URL_CACHE_SCHEMA,
+        _IGNORE_RE.pattern,
+        sorted(FILE_EXTENSION_TYPES.items()),
+        DOMAIN_TYPE_RULES,
+        ARTICLE_PATHS,
+        sorted(TYPES_BEFORE_ARTICLE_PATHS),
+        sorted(TITLE_RESOURCE_TYPES),
+        sorted(CANONICAL_HOSTS),
+    )
+    return hashlib.sha1(repr(rules).encode()).hexdigest()
+
+
+def load_url_cache() -> Dict[str, Dict]:
+    """
+    Load {url: {url, domain, type, title, fetched_at}} from a previous run.
+
+    Rows older than ``URL_CACHE_MAX_AGE`` are dropped, and so is the whole
+    cache when it was written by another version of the classification rules.
+    Empty if the file is missing or invalid.
+    """
+    path = _url_cache_path()
+    if not path.exists():
+        return {}
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _url_cache_version():
+        return {}
+    oldest = time.time() - URL_CACHE_MAX_AGE.total_seconds()
+    return {
+        url: row
+        for url, row in (data.get("urls") or {}).items()
+        if isinstance(row, dict) and row.get("fetched_at", 0) >= oldest
+    }
+
+
+def save_url_cache(cache: Dict[str, Dict]) -> None:
+    """Persist the URL cache for the next run, replacing the file atomically."""
+    path = _url_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write next to the cache and swap it in, so an interrupted run never
+    # leaves a truncated file behind
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(orjson.dumps({"version": _url_cache_version(), "urls": cache}))
+    tmp_path.replace(path)
+
+
+def build_resource_rows_by_source(
+    urls_by_source: Dict[str, List[str]], url_cache: Optional[Dict[str, Dict]] = None
+) -> List[Dict]:
+    """
+    Resolve and categorize URLs of many sources into rows for ``write_resource_rows``.
+
+    Each distinct URL is enriched once, however many sources reference it;
+    the HTTP probes (redirects, titles) run on a pool of ``URL_FETCH_WORKERS``
+    threads. Rows keep the input order.
+
+    Args:
+        urls_by_source: Mapping of source URN (Post or Comment) to its URLs
+        url_cache: Optional {url: enriched row} mapping (see ``load_url_cache``).
+            Cached URLs skip the network; newly enriched ones are added to it
+            with a ``fetched_at`` timestamp. Failed or ignored URLs are not
+            cached so they are retried next run.
+
+    Returns:
+        List of row dicts with source_urn, url, domain, type and title
+    """
+    pending = [
+        (source_urn, url)
+        for source_urn, urls in urls_by_source.items()
+        for url in urls
+        if not should_ignore_url(url)
+    ]
+    if not pending:
+        return []
+
+    cache = url_cache if url_cache is not None else {}
+    unique_urls = list(dict.fromkeys(url for _, url in pending))
+    enriched: Dict[str, Optional[Dict]] = {
+        url: cache[url] for url in unique_urls if url in cache
+    }
+    to_fetch = [url for url in unique_urls if url not in enriched]
+    if to_fetch:
+        worker_sessions: List[requests.Session] = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=URL_FETCH_WORKERS,
+                initializer=_register_worker_session,
+                initargs=(worker_sessions,),
+            ) as executor:
+                fetched = dict(zip(to_fetch, executor.map(_enrich_url, to_fetch)))
+        finally:
+            # The worker threads are gone: release their pooled connections
+            for session in worker_sessions:
+                session.close()
+        enriched.update(fetched)
+        skipped = sum(1 for info in fetched.values() if not info)
+        if skipped:
+            print(
+                f"   ⚠️  {skipped} of {len(to_fetch)} URLs skipped "
+                "(failed, or redirected to an ignored page)"
+            )
+        fetched_at = time.time()
+        cache.update(
+            (url, {**info, "fetched_at": fetched_at})
+            for url, info in fetched.items()
+            if info
+        )
+
+    rows = []
+    for source_urn, url in pending:
+        info = enriched[url]
+        if info:
+            rows.append(
+                {
+                    "source_urn": source_urn,
+                    "url": info["url"],
+                    "domain": info["domain"],
+                    "type": info["type"],
+                    "title": info["title"],
+                }
+            )
+    return rows
+
+
+def build_resource_rows(source_urn: str, urls: List[str]) -> List[Dict]:
+    """
+    Resolve and categorize URLs into rows for ``write_resource_rows``.
+
+    Args:
+        source_urn: URN of the source (Post or Comment)
+        urls: List of URLs referenced by the source
+
+    Returns:
+        List of row dicts with source_urn, url, domain, type and title
+    """
+    return build_resource_rows_by_source({source_urn: urls})
+
+
+def ensure_resource_indexes(driver, database: str = "neo4j") -> None:
+    """
+    Create the indexes used when merging Resource nodes, if missing.
+
+    Args:
+        driver: Neo4j driver
+        database: Neo4j database name
+    """
+    with driver.session(database=database) as session:
+        for query in RESOURCE_INDEX_QUERIES:
+            session.run(query).consume()
+
+
+def merge_resources_batch(tx, resources: List[Dict]) -> None:
+    """
+    Merge Resource nodes for a batch of unique URLs.
+
+    Args:
+        tx: Neo4j transaction
+        resources: Dicts with url, domain, type and title (one per URL)
+    """
+    query = """
+    UNWIND $resources AS row
+    MERGE (resource:Resource {url: row.url})
+    SET resource.domain = row.domain,
+        resource.type = row.type,
+        resource.title = coalesce(row.title, resource.title)
+    """
+    tx.run(query, resources=resources).consume()
+
+
+def create_references_batch(tx, rows: List[Dict], source_type: str) -> Dict[str, int]:
+    """
+    Merge REFERENCES relationships from sources to existing Resource nodes.
+
+    Args:
+        tx: Neo4j transaction
+        rows: Row dicts from ``build_resource_rows``
+        source_type: Label of the source nodes ("Post" or "Comment")
+
+    Returns:
+        Mapping of source URN to number of resources linked
+    """
+    query = f"""
+    UNWIND $rows AS row
+    MATCH (source:{source_type} {{urn: row.source_urn}})
+    MATCH (resource:Resource {{url: row.url}})
+    MERGE (source)-[:REFERENCES]->(resource)
+    RETURN source.urn AS source_urn, count(*) AS created
+    """
+    result = tx.run(query, rows=rows)
+    return {record["source_urn"]: record["created"] for record in result}
+
+
+def _unique_resources(rows: List[Dict]) -> List[Dict]:
+    """Collapse rows to one Resource per URL, keeping the first title found."""
+    resources: Dict[str, Dict] = {}
+    for row in rows:
+        existing = resources.get(row["url"])
+        if existing is None or (not existing["title"] and row["title"]):
+            resources[row["url"]] = {
+                "url": row["url"],
+                "domain": row["domain"],
+                "type": row["type"],
+                "title": row["title"],
+            }
+    return list(resources.values())
+
+
+def write_resource_rows(
+    driver,
+    rows: List[Dict],
+    source_type: str = "Post",
+    database: str = "neo4j",
+) -> Dict[str, int]:
+    """
+    Write resource rows to Neo4j in batches of ``RESOURCE_BATCH_SIZE``.
+
+    Resource nodes are merged once per unique URL first, then the
+    REFERENCES relationships are merged against them, so a URL shared by
+    many sources costs one node MERGE instead of one per source.
+
+    Args:
+        driver: Neo4j driver
+        rows: Row dicts from ``build_resource_rows``
+        source_type: Type of source node ("Post" or "Comment")
+        database: Neo4j database name
+
+    Returns:
+        Mapping of source URN to number of resources linked
+    """
+    resources = _unique_resources(rows)
+    created: Dict[str, int] = {}
+    with driver.session(database=database) as session:
+        for i in range(0, len(resources), RESOURCE_BATCH_SIZE):
+            batch = resources[i : i + RESOURCE_BATCH_SIZE]
+            session.execute_write(merge_resources_batch, batch)
+
+        for i in range(0, len(rows), RESOURCE_BATCH_SIZE):
+            batch = rows[i : i + RESOURCE_BATCH_SIZE]
+            counts = session.execute_write(create_references_batch, batch, source_type)
+            for source_urn, count in counts.items():
+                created[source_urn] = created.get(source_urn, 0) + count
+
+    # Source nodes not found - this shouldn't happen but report it once
+    missing = [
+        source_urn
+        for source_urn in dict.fromkeys(row["source_urn"] for row in rows)
+        if source_urn not in created
+    ]
+    if missing:
+        print(f"   ⚠️  {len(missing)} {source_type} source nodes not found")
+        for source_urn in missing:
+            logger.debug("Source %s node not found: %s", source_type, source_urn)
+    return created
+
+
 def create_resource_nodes_and_relationships(
     driver,
     source_urn: str,
@@ -636,73 +1190,22 @@ def create_resource_nodes_and_relationships(
     Returns:
         Number of resources created
     """
-    created = 0
-
-    # Use a single session for all operations to avoid connection issues
+    rows = build_resource_rows(source_urn, urls)
+    if not rows:
+        return 0
     try:
-        with driver.session(database=database) as session:
-            for url in urls:
-                if should_ignore_url(url):
-                    continue
-
-                try:
-                    # Resolve redirects to get final URL
-                    url = resolve_redirect(url)
-
-                    url_info = categorize_url(url)
-                    if not url_info["domain"]:
-                        continue
-
-                    # Extract title from URL
-                    title = extract_title_from_url(url)
-
-                    # Build SET clauses conditionally
-                    create_set = "resource.domain = $domain, resource.type = $type"
-                    match_set = "resource.domain = $domain, resource.type = $type"
-
-                    params = {
-                        "source_urn": source_urn,
-                        "url": url,
-                        "domain": url_info["domain"],
-                        "type": url_info["type"],
-                    }
-
-                    if title:
-                        create_set += ", resource.title = $title"
-                        match_set += ", resource.title = $title"
-                        params["title"] = title
-
-                    query = f"""
-                    MATCH (source:{source_type} {{urn: $source_urn}})
-                    MERGE (resource:Resource {{url: $url}})
-                    ON CREATE SET {create_set}
-                    ON MATCH SET {match_set}
-                    MERGE (source)-[:REFERENCES]->(resource)
-                    RETURN resource.url as url, source.urn as source_urn
-                    """
-
-                    result = session.run(query, **params)
-                    record = result.single()
-                    if record:
-                        created += 1
-                    else:
-                        # Source node not found - this shouldn't happen but log it
-                        print(
-                            f"   ⚠️  Source {source_type} node not found: {source_urn}"
-                        )
-                except Exception as e:
-                    # Log error but continue with next URL
-                    print(f"   ⚠️  Error processing URL {url}: {str(e)}")
-                    continue
+        created = write_resource_rows(driver, rows, source_type, database)
     except Exception as e:
         print(f"   ❌ Error creating session for {source_urn}: {str(e)}")
         raise
-
-    return created
+    return created.get(source_urn, 0)
 
 
 def enrich_posts_with_resources(
-    driver, json_file: Optional[str] = None, database: str = "neo4j"
+    driver,
+    json_file: Optional[str] = None,
+    database: str = "neo4j",
+    use_url_cache: bool = True,
 ):
     """
     Extract resources from posts and comments, create Resource nodes.
@@ -711,6 +1214,7 @@ def enrich_posts_with_resources(
         driver: Neo4j driver
         json_file: Optional path to JSON file for full text extraction
         database: Neo4j database name
+        use_url_cache: Reuse URLs enriched by previous runs (see ``load_url_cache``)
     """
     print("\n🔍 Extracting external resources from posts and comments...")
 
@@ -725,8 +1229,9 @@ def enrich_posts_with_resources(
         )
     else:
         # Extract from Neo4j (may be truncated)
+        # Posts are materialized: the loop below may fetch post URLs over HTTP,
+        # which should not hold a Neo4j session open.
         posts = get_posts_with_content(driver, database=database)
-        comments = get_comments_with_text(driver, database=database)
 
         post_resources = {}
         for post in posts:
@@ -746,7 +1251,7 @@ def enrich_posts_with_resources(
             if (not urls or is_truncated) and not USE_API_CONTENT_ONLY:
                 post_url = post.get("url")
                 if post_url and not is_comment_feed_url(post_url):
-                    print(f"   🔄 Fetching content from post URL: {post_url}")
+                    logger.debug("Fetching content from post URL: %s", post_url)
                     full_content = fetch_post_content_from_url(post_url)
                     if full_content:
                         urls = extract_urls_from_text(full_content)
@@ -754,44 +1259,53 @@ def enrich_posts_with_resources(
                 post_resources[post["urn"]] = urls
 
         comment_resources = {}
-        for comment in comments:
+        comment_count = 0
+        for comment in iter_comments_with_text(driver, database=database):
+            comment_count += 1
             urls = extract_urls_from_text(comment["text"])
             if urls:
                 comment_resources[comment["urn"]] = urls
 
         print(
-            f"📊 Found {len(posts)} posts and {len(comments)} comments with text in Neo4j"
+            f"📊 Found {len(posts)} posts and {comment_count} comments with text in Neo4j"
         )
 
     if not post_resources and not comment_resources:
         print("✅ No posts or comments with resources found!\n")
         return
 
-    total_resources = 0
-    processed_posts = 0
-    processed_comments = 0
+    ensure_resource_indexes(driver, database=database)
+
+    # Resolve every URL first (concurrently), then write each source type in
+    # UNWIND batches over a single session instead of one query per URL.
+    created_by_post: Dict[str, int] = {}
+    created_by_comment: Dict[str, int] = {}
+    url_cache = load_url_cache() if use_url_cache else None
 
     # Process posts
     if post_resources:
         print(f"📊 Processing resources from {len(post_resources)} posts...")
-        for post_urn, urls in post_resources.items():
-            count = create_resource_nodes_and_relationships(
-                driver, post_urn, urls, source_type="Post", database=database
+        rows = build_resource_rows_by_source(post_resources, url_cache)
+        if rows:
+            created_by_post = write_resource_rows(
+                driver, rows, source_type="Post", database=database
             )
-            if count > 0:
-                total_resources += count
-                processed_posts += 1
 
     # Process comments
     if comment_resources:
         print(f"📊 Processing resources from {len(comment_resources)} comments...")
-        for comment_urn, urls in comment_resources.items():
-            count = create_resource_nodes_and_relationships(
-                driver, comment_urn, urls, source_type="Comment", database=database
+        rows = build_resource_rows_by_source(comment_resources, url_cache)
+        if rows:
+            created_by_comment = write_resource_rows(
+                driver, rows, source_type="Comment", database=database
             )
-            if count > 0:
-                total_resources += count
-                processed_comments += 1
+
+    if url_cache is not None:
+        save_url_cache(url_cache)
+
+    total_resources = sum(created_by_post.values()) + sum(created_by_comment.values())
+    processed_posts = len(created_by_post)
+    processed_comments = len(created_by_comment)
 
     print(
         f"✅ Created {total_resources} resource nodes from {processed_posts} posts and {processed_comments} comments"
@@ -77,10 +77,10 @@ def get_max_processed_at(elements: List[dict]) -> Optional[int]:
     Returns:
         Maximum processedAt timestamp in epoch milliseconds, or None if no valid timestamps found.
     """
-    timestamps = [
-        val for elem in elements if isinstance((val := elem.get("processedAt")), int)
-    ]
-    return max(timestamps) if timestamps else None
+    return max(
+        (val for elem in elements if isinstance((val := elem.get("processedAt")), int)),
+        default=None,
+    )
 
 
 def fetch_changelog_data(
@@ -8,6 +8,16 @@ import re
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, parse_qsl, unquote, urlencode, urlparse, urlunparse
 
+# Compiled once at import: URLs in free text. The last character may not be
+# trailing punctuation or a closing parenthesis, so matches need no stripping.
+URL_RE = re.compile(r"https?://[^\s<>\"'{}|\\^`\[\]]+[^\s<>\"'{}|\\^`\[\].,;:!?)]")
+
+_HASHTAG_PATH_RE = re.compile(r"/hashtag/([^/?#]+)", re.I)
+# Profile, company or school paths (matched against a lowercased path)
+_MENTION_PATH_RE = re.compile(r"/(?:in|company|school)/[^/]+")
+# Any URL in interstitial page text; trailing punctuation is stripped after
+_LOOSE_URL_RE = re.compile(r"https?://\S+")
+
 
 def linkedin_hashtag_keyword(url: str) -> Optional[str]:
     """Hashtag text from a LinkedIn hashtag URL, or None if not a hashtag link."""
@@ -17,7 +27,7 @@ def linkedin_hashtag_keyword(url: str) -> Optional[str]:
         path = urlparse(url.strip()).path
     except Exception:
         return None
-    m = re.search(r"/hashtag/([^/?#]+)", path, re.I)
+    m = _HASHTAG_PATH_RE.search(path)
     if not m:
         return None
     return unquote(m.group(1)).strip() or None
@@ -87,11 +97,7 @@ def is_linkedin_mention_url(url: str) -> bool:
         path = urlparse(url.strip()).path.lower()
     except Exception:
         return False
-    return bool(
-        re.match(r"/in/[^/]+", path)
-        or re.match(r"/company/[^/]+", path)
-        or re.match(r"/school/[^/]+", path)
-    )
+    return bool(_MENTION_PATH_RE.match(path))
 
 
 def extract_classified_links(
@@ -127,6 +133,39 @@ def extract_classified_links(
     return resource_urls, list(mentions_map.values()), sorted(tags_set)
 
 
+def url_host_and_path(url: str) -> Tuple[str, str]:
+    """Return the lowercased ``(netloc, path)`` of *url*.
+
+    Plain http(s) URLs are split with string searches, which is much cheaper
+    than building a ``urlparse`` result; anything unusual falls back to
+    ``urlparse`` so the result is the same either way.
+    """
+    lowered = url.lower()
+    if not lowered.startswith(("http://", "https://")) or any(
+        c in lowered for c in "\t\r\n[]"
+    ):
+        parsed = urlparse(lowered)
+        return parsed.netloc, parsed.path
+
+    start = lowered.index("://") + 3
+    host_end = len(lowered)
+    for sep in "/?#":
+        i = lowered.find(sep, start, host_end)
+        if i >= 0:
+            host_end = i
+    path_end = len(lowered)
+    for sep in "?#":
+        i = lowered.find(sep, host_end, path_end)
+        if i >= 0:
+            path_end = i
+    path = lowered[host_end:path_end]
+    # Like urlparse, drop ";params" from the last path segment.
+    params = path.find(";", path.rfind("/"))
+    if params >= 0:
+        path = path[:params]
+    return lowered[start:host_end], path
+
+
 def extract_urls_from_text(text: str) -> List[str]:
     """
     Extract all URLs from text using regex.
@@ -135,25 +174,21 @@ def extract_urls_from_text(text: str) -> List[str]:
         text: Text content to search for URLs
 
     Returns:
-        List of unique URLs found
+        List of unique URLs found, in order of first appearance
     """
-    if not text:
+    # Most texts carry no link; a substring test is far cheaper than the regex.
+    if not text or "http" not in text:
         return []
 
-    url_pattern = r"https?://[^\s<>\"'{}|\\^`\[\]]+[^\s<>\"'{}|\\^`\[\].,;:!?]"
-    urls = re.findall(url_pattern, text)
-
-    cleaned_urls = []
-    for url in urls:
-        url = url.rstrip(".,;:!?)")
-        try:
-            parsed = urlparse(url)
-            if parsed.netloc:
-                cleaned_urls.append(url)
-        except Exception:
+    # dict keys dedupe in one pass and keep first-seen order.
+    cleaned_urls: Dict[str, None] = {}
+    for url in URL_RE.findall(text):
+        if url in cleaned_urls:
             continue
+        if url_host_and_path(url)[0]:
+            cleaned_urls[url] = None
 
-    return list(set(cleaned_urls))
+    return list(cleaned_urls)
 
 
 def categorize_url(url: str) -> Dict[str, Optional[str]]:
@@ -164,9 +199,7 @@ def categorize_url(url: str) -> Dict[str, Optional[str]]:
         Dict with 'domain' and 'type' keys
     """
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        path = parsed.path.lower()
+        domain, path = url_host_and_path(url)
 
         if domain.startswith("www."):
             domain = domain[4:]
@@ -375,7 +408,7 @@ def resolve_redirect(url: str, max_redirects: int = 5) -> str:
             # excludes URLs buried in HTML attributes (script src, link href…).
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, "html.parser")
-                for found in re.findall(r"https?://\S+", soup.get_text()):
+                for found in _LOOSE_URL_RE.findall(soup.get_text()):
                     found_str = str(found).rstrip(".,;:!?)")
                     found_lower = found_str.lower()
                     if (
@@ -14,14 +14,19 @@ Usage:
 
 Options:
   --dry-run  Report what would be changed without writing.
+
+Lookups and fixes match posts by urn in bulk (UNWIND), so the script first
+creates the Post(urn) index if missing, the same one as
+extract_resources.ensure_resource_indexes. A --dry-run leaves the schema
+untouched, so its lookups may be slow on a graph without that index.
 """
 
 import argparse
-import json
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
 
@@ -32,93 +37,118 @@ NEO4J_USERNAME = os.getenv("NEO4J_USERNAME") or "neo4j"
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD") or "password"
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE") or "neo4j"
 
+# Rows (or post urns) per UNWIND query when looking up and rewriting repost authors
+FIX_BATCH_SIZE = 1000
+
+# Backs every MATCH (post:Post {urn: ...}) below
+POST_URN_INDEX_QUERY = "CREATE INDEX post_urn IF NOT EXISTS FOR (n:Post) ON (n.urn)"
+
 
 def load_extraction_json(path: Path) -> dict:
     """Load neo4j_data JSON (nodes have id, labels, properties; rels have startNode, endNode, type)."""
-    with open(path, encoding="utf-8") as f:
-        data: dict[str, Any] = json.load(f)
+    with open(path, "rb") as f:
+        data: dict[str, Any] = orjson.loads(f.read())
         return data
 
 
 def build_reposter_map(data: dict) -> dict:
     """Build map repost_share_urn -> reposter_urn from extraction JSON."""
-    nodes = data.get("nodes", [])
-    relationships = data.get("relationships", [])
     repost_shares = set()
-    for node in nodes:
-        labels = node.get("labels") or []
-        if "Post" not in labels:
-            continue
-        props = node.get("properties") or {}
-        if props.get("original_post_urn"):
-            repost_shares.add(node.get("id"))
-    person_urns = {n["id"] for n in nodes if "Person" in (n.get("labels") or [])}
+    person_urns = set()
+    for node in data.get("nodes", []):
+        labels = node.get("labels") or ()
+        if "Post" in labels:
+            if (node.get("properties") or {}).get("original_post_urn"):
+                repost_shares.add(node.get("id"))
+        elif "Person" in labels:
+            person_urns.add(node.get("id"))
     reposter_map = {}
-    for rel in relationships:
+    for rel in data.get("relationships", []):
         if rel.get("type") != "REPOSTS":
             continue
-        start = rel.get("startNode")
-        end = rel.get("endNode")
+        start, end = rel.get("startNode"), rel.get("endNode")
         if start in person_urns and end in repost_shares:
             reposter_map[end] = start
     return reposter_map
 
 
-def get_repost_shares_in_db(driver) -> list:
-    """Return list of (post_urn,) for Post nodes that have original_post_urn."""
+def get_repost_shares_in_db(session, post_urns: list[str]) -> list[str]:
+    """Return the urns among post_urns whose Post has original_post_urn.
+    Looks up only the given urns, in queries of FIX_BATCH_SIZE, instead of
+    scanning every Post."""
     query = """
-    MATCH (post:Post)
-    WHERE post.original_post_urn IS NOT NULL AND post.urn IS NOT NULL
+    UNWIND $urns AS urn
+    MATCH (post:Post {urn: urn})
+    WHERE post.original_post_urn IS NOT NULL
     RETURN post.urn as urn
     """
-    with driver.session(database=NEO4J_DATABASE) as session:
-        result = session.run(query)
-        return [record["urn"] for record in result]
+    repost_urns: list[str] = []
+    for i in range(0, len(post_urns), FIX_BATCH_SIZE):
+        result = session.run(query, urns=post_urns[i : i + FIX_BATCH_SIZE])
+        repost_urns.extend(record["urn"] for record in result)
+    return repost_urns
+
 
+def ensure_post_urn_index(session) -> None:
+    """Create the Post(urn) index used by the lookups and fixes, if missing."""
+    session.run(POST_URN_INDEX_QUERY).consume()
 
-def get_current_author_of_post(driver, post_urn: str) -> Optional[str]:
-    """Return the URN of the Person that has CREATES or REPOSTS to this post, or None."""
+
+def get_current_authors(session, post_urns: list[str]) -> dict[str, str]:
+    """Return {post_urn: person_urn} of a Person with CREATES or REPOSTS to each post,
+    in queries of FIX_BATCH_SIZE urns. Posts without such a Person are absent."""
     query = """
-    MATCH (p:Person)-[r:CREATES|REPOSTS]->(post:Post {urn: $urn})
-    RETURN p.urn as person_urn
-    LIMIT 1
+    UNWIND $urns AS urn
+    MATCH (p:Person)-[r:CREATES|REPOSTS]->(post:Post {urn: urn})
+    RETURN urn, head(collect(p.urn)) as person_urn
     """
-    with driver.session(database=NEO4J_DATABASE) as session:
-        result = session.run(query, urn=post_urn)
-        record = result.single()
-        return record["person_urn"] if record else None
-
-
-def fix_repost_author(
-    driver, post_urn: str, correct_reposter_urn: str, dry_run: bool
-) -> bool:
-    """Remove existing CREATES/REPOSTS, then MERGE (reposter)-[:REPOSTS]->(post)."""
-    if dry_run:
-        return True
-    person_id = (
-        correct_reposter_urn.split(":")[-1]
-        if ":" in correct_reposter_urn
-        else correct_reposter_urn
-    )
+    authors: dict[str, str] = {}
+    for i in range(0, len(post_urns), FIX_BATCH_SIZE):
+        result = session.run(query, urns=post_urns[i : i + FIX_BATCH_SIZE])
+        authors.update((record["urn"], record["person_urn"]) for record in result)
+    return authors
+
+
+def _person_id(person_urn: str) -> str:
+    """Trailing id of a person URN (urn:li:person:abc -> abc)."""
+    return person_urn.split(":")[-1] if ":" in person_urn else person_urn
+
+
+def fix_repost_authors_tx(tx, rows: list[dict]) -> int:
+    """For each row: remove existing CREATES/REPOSTS, then MERGE
+    (reposter)-[:REPOSTS]->(post), in one UNWIND query. Returns posts fixed."""
     query = """
-    MATCH (post:Post {urn: $post_urn})
+    UNWIND $rows AS row
+    MATCH (post:Post {urn: row.post_urn})
     OPTIONAL MATCH (any_person:Person)-[r:CREATES|REPOSTS]->(post)
-    WITH post, r
     DELETE r
-    WITH post
-    MERGE (reposter:Person {urn: $reposter_urn})
-    ON CREATE SET reposter.person_id = $person_id
+    WITH DISTINCT row, post
+    MERGE (reposter:Person {urn: row.reposter_urn})
+    ON CREATE SET reposter.person_id = row.person_id
     MERGE (reposter)-[:REPOSTS]->(post)
-    RETURN post.urn as urn
+    RETURN count(post) as fixed
     """
-    with driver.session(database=NEO4J_DATABASE) as session:
-        result = session.run(
-            query,
-            post_urn=post_urn,
-            reposter_urn=correct_reposter_urn,
-            person_id=person_id,
+    record = tx.run(query, rows=rows).single()
+    return record["fixed"] if record else 0
+
+
+def fix_repost_authors_batch(session, fixes: list[tuple[str, str]]) -> int:
+    """Fix (post_urn, reposter_urn) pairs in FIX_BATCH_SIZE write transactions
+    (retried by the driver on transient errors). Returns posts fixed."""
+    rows = [
+        {
+            "post_urn": post_urn,
+            "reposter_urn": reposter_urn,
+            "person_id": _person_id(reposter_urn),
+        }
+        for post_urn, reposter_urn in fixes
+    ]
+    fixed = 0
+    for i in range(0, len(rows), FIX_BATCH_SIZE):
+        fixed += session.execute_write(
+            fix_repost_authors_tx, rows[i : i + FIX_BATCH_SIZE]
         )
-        return result.single() is not None
+    return fixed
 
 
 def main():
@@ -194,34 +224,43 @@ def main():
         print(f"Neo4j connection failed: {e}")
         return 1
 
-    repost_urns_in_db = get_repost_shares_in_db(driver)
-    updated = 0
-    skipped_no_mapping = 0
-    skipped_already_correct = 0
-    for post_urn in repost_urns_in_db:
-        correct_reposter = reposter_map.get(post_urn)
-        if not correct_reposter:
-            skipped_no_mapping += 1
-            continue
-        current = get_current_author_of_post(driver, post_urn)
-        if current == correct_reposter:
-            skipped_already_correct += 1
-            continue
+    # One session for every read and write of the run
+    with driver.session(database=NEO4J_DATABASE) as session:
         if args.dry_run:
             print(
-                f"Would fix: {post_urn}  current={current}  correct={correct_reposter}"
+                "Dry run: Post(urn) index not created; lookups may be slow without it."
             )
         else:
-            fix_repost_author(driver, post_urn, correct_reposter, dry_run=False)
-        updated += 1
+            ensure_post_urn_index(session)
+        repost_urns_in_db = get_repost_shares_in_db(session, list(reposter_map))
+        skipped_not_in_db = len(reposter_map) - len(repost_urns_in_db)
+        skipped_already_correct = 0
+        current_authors = get_current_authors(session, repost_urns_in_db)
+        fixes: list[tuple[str, str]] = []
+        for post_urn in repost_urns_in_db:
+            correct_reposter = reposter_map[post_urn]
+            current = current_authors.get(post_urn)
+            if current == correct_reposter:
+                skipped_already_correct += 1
+                continue
+            if args.dry_run:
+                print(
+                    f"Would fix: {post_urn}  current={current}  correct={correct_reposter}"
+                )
+            fixes.append((post_urn, correct_reposter))
+        if args.dry_run:
+            updated = len(fixes)
+        else:
+            # Posts actually rewritten; a fix whose post vanished matches nothing
+            updated = fix_repost_authors_batch(session, fixes) if fixes else 0
 
-    print(f"Repost shares in DB: {len(repost_urns_in_db)}")
     print(f"In JSON mapping: {len(reposter_map)}")
+    print(f"Repost shares in DB: {len(repost_urns_in_db)}")
     if args.dry_run:
         print(f"Would update: {updated}")
     else:
         print(f"Updated: {updated}")
-    print(f"Skipped (no mapping in JSON): {skipped_no_mapping}")
+    print(f"Skipped (not a repost share in DB): {skipped_not_in_db}")
     print(f"Skipped (already correct): {skipped_already_correct}")
     driver.close()
     return 0
@@ -0,0 +1,103 @@
+"""Tests for analyze_activity statistics (resource classification and counting)."""
+
+import json
+
+import pytest
+
+from linkedin_api import analyze_activity
+from linkedin_api.analyze_activity import (
+    _classify_resource,
+    extract_statistics,
+    save_statistics,
+)
+
+
+@pytest.mark.parametrize(
+    "resource_name,expected",
+    [
+        ("messages", "messages"),
+        ("invitations", "invites"),
+        ("socialActions/likes", "reactions"),
+        ("reactions", "reactions"),
+        ("ugcPosts", "posts"),
+        ("socialActions/comments", "comments"),
+        ("memberFollowers", None),
+        ("", None),
+    ],
+)
+def test_classify_resource(resource_name, expected):
+    assert _classify_resource(resource_name) == expected
+
+
+def test_extract_statistics_counts_by_bucket():
+    user = "urn:li:person:me"
+    elements = [
+        {"resourceName": "messages", "actor": user, "activity": {}},
+        {"resourceName": "messages", "actor": "urn:li:person:x", "activity": {}},
+        {"resourceName": "invitations", "actor": user, "activity": {}},
+        {
+            "resourceName": "socialActions/likes",
+            "actor": user,
+            "activity": {"reactionType": "LIKE", "root": "urn:li:share:1"},
+        },
+        {"resourceName": "ugcPosts", "actor": user, "activity": {}},
+        {
+            "resourceName": "socialActions/comments",
+            "actor": user,
+            "activity": {"id": "1", "object": "urn:li:share:1"},
+        },
+    ]
+
+    stats = extract_statistics(elements)
+
+    assert stats["messages"] == {"sent": 1, "received": 1, "total": 2}
+    assert stats["invites"] == {"sent": 1, "received": 0, "total": 1}
+    assert dict(stats["reactions"]) == {"LIKE": 1}
+    assert stats["posts"]["original"] == 1
+    assert stats["comments"]["total"] == 1
+    assert stats["data_quality"]["importable"] == len(elements)
+    assert stats["skipped_elements"] == []
+
+
+def test_save_statistics_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyze_activity, "OUTPUT_DIR", tmp_path)
+    elements = [
+        {
+            "resourceName": "socialActions/likes",
+            "actor": "urn:li:person:me",
+            "activity": {"reactionType": "LIKE", "root": "urn:li:share:1"},
+        },
+        {"resourceName": "socialActions/likes", "actor": "", "activity": {}},
+    ]
+    stats = extract_statistics(elements)
+
+    save_statistics(stats, "stats.json")
+
+    (saved,) = tmp_path.glob("stats_*[0-9].json")
+    loaded = json.loads(saved.read_text(encoding="utf-8"))
+    assert loaded["reactions"] == {"LIKE": 1, "UNKNOWN": 1}
+    assert loaded["data_quality"]["skipped_by_reason"] == {"reaction_no_post_urn": 1}
+    (skipped,) = tmp_path.glob("stats_*_skipped.json")
+    assert len(json.loads(skipped.read_text(encoding="utf-8"))) == 1
+
+
+def test_skipped_elements_keep_identifying_fields_only():
+    element = {
+        "id": 42,
+        "resourceName": "socialActions/comments",
+        "actor": "urn:li:person:me",
+        "activity": {"object": "urn:li:share:1", "message": {"text": "long"}},
+    }
+
+    (skipped,) = extract_statistics([element])["skipped_elements"]
+    assert skipped == {
+        "reason": "comment_no_id",
+        "resource_name": "socialActions/comments",
+        "element_id": 42,
+        "activity_id": None,
+        "activity_object": "urn:li:share:1",
+        "activity_actor": None,
+    }
+
+    (raw,) = extract_statistics([element], keep_raw_skipped=True)["skipped_elements"]
+    assert raw["element"] is element
@@ -0,0 +1,70 @@
+"""Tests for save_neo4j_data: streamed output must be one valid JSON document."""
+
+import json
+
+from linkedin_api import extract_graph_data
+from linkedin_api.extract_graph_data import save_neo4j_data
+
+
+def test_save_neo4j_data_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setattr(extract_graph_data, "OUTPUT_DIR", tmp_path)
+    data = {
+        "nodes": [
+            {
+                "id": "urn:li:person:abc",
+                "label": "Person",
+                "properties": {"urn": "urn:li:person:abc"},
+            },
+            {
+                "id": "urn:li:share:1",
+                "label": "Post",
+                "properties": {"urn": "urn:li:share:1", "content": "héllo"},
+            },
+        ],
+        "relationships": [
+            {
+                "type": "CREATES",
+                "from": "urn:li:person:abc",
+                "to": "urn:li:share:1",
+                "properties": {"timestamp": 1766750428159},
+            }
+        ],
+        "statistics": {"people": 1, "posts": 1, "comments": 0, "relationships": 1},
+    }
+
+    save_neo4j_data(data, "graph.json")
+
+    (saved,) = tmp_path.glob("graph_*.json")
+    loaded = json.loads(saved.read_text(encoding="utf-8"))
+    assert loaded["nodes"] == [
+        {
+            "id": "urn:li:person:abc",
+            "labels": ["Person"],
+            "properties": {"urn": "urn:li:person:abc"},
+        },
+        {
+            "id": "urn:li:share:1",
+            "labels": ["Post"],
+            "properties": {"urn": "urn:li:share:1", "content": "héllo"},
+        },
+    ]
+    assert loaded["relationships"] == [
+        {
+            "type": "CREATES",
+            "startNode": "urn:li:person:abc",
+            "endNode": "urn:li:share:1",
+            "properties": {"timestamp": 1766750428159},
+        }
+    ]
+    assert loaded["statistics"] == data["statistics"]
+
+
+def test_save_neo4j_data_handles_empty_graph(tmp_path, monkeypatch):
+    monkeypatch.setattr(extract_graph_data, "OUTPUT_DIR", tmp_path)
+    stats = {"people": 0, "posts": 0, "comments": 0, "relationships": 0}
+
+    save_neo4j_data({"nodes": [], "relationships": [], "statistics": stats})
+
+    (saved,) = tmp_path.glob("neo4j_data_*.json")
+    loaded = json.loads(saved.read_text(encoding="utf-8"))
+    assert loaded == {"nodes": [], "relationships": [], "statistics": stats}
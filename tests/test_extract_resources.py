@@ -1,18 +1,51 @@
 """Unit tests for extract_resources module."""
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 import pytest
+import requests
+from urllib3.exceptions import ProtocolError
 
 from linkedin_api.utils.urls import extract_urls_from_text
 
+from linkedin_api import extract_resources
 from linkedin_api.extract_resources import (
+    build_resource_rows,
+    build_resource_rows_by_source,
     categorize_url,
+    classify_url,
+    create_references_batch,
+    ensure_resource_indexes,
+    extract_resources_from_json,
+    merge_resources_batch,
     extract_title_from_url,
+    fetch_final_url_and_title,
+    get_posts_with_content,
+    load_url_cache,
     resolve_redirect,
+    save_url_cache,
     should_ignore_url,
+    write_resource_rows,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_url_caches():
+    """Each test mocks HTTP differently, so never reuse a cached lookup."""
+    caches = (
+        extract_resources._try_resolve_redirect,
+        extract_title_from_url,
+        fetch_final_url_and_title,
+    )
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
 class TestExtractUrlsFromText:
     """Test URL extraction from text."""
 
@@ -91,6 +124,33 @@ class TestCategorizeUrl:
         result = categorize_url("https://example.com/image.png")
         assert result["type"] == "image"
 
+    @pytest.mark.parametrize(
+        "url,expected_type",
+        [
+            ("https://x.com/user/status/1", "social"),
+            ("https://mobile.twitter.com/user", "social"),
+            ("https://www.netflix.com/title/1", "article"),
+            ("https://m.youtube.com/watch?v=abc", "video"),
+            ("https://notyoutube.com/watch", "article"),
+            ("https://docs.python.org/3/", "documentation"),
+        ],
+    )
+    def test_domains_match_on_label_boundaries(self, url, expected_type):
+        """Full domains match subdomains only, not names that contain them."""
+        assert categorize_url(url)["type"] == expected_type
+
+    def test_extension_only_read_from_path(self):
+        """Extensions in the query string or mid-path do not decide the type."""
+        assert categorize_url("https://example.com/Report.PDF?v=2")["type"] == (
+            "document"
+        )
+        assert categorize_url("https://example.com/get?file=a.mp4")["type"] == (
+            "article"
+        )
+        assert categorize_url("https://example.com/docs.pdfs/intro")["type"] == (
+            "article"
+        )
+
     def test_categorize_medium_article(self):
         """Test categorizing Medium articles."""
         result = categorize_url("https://medium.com/@user/article-title")
@@ -141,10 +201,304 @@ class TestShouldIgnoreUrl:
         assert should_ignore_url("https://www.linkedin.com/pulse/article") is False
 
 
+class TestClassifyUrl:
+    """Test combined ignore check and categorization."""
+
+    def test_ignored_linkedin_url_returns_none(self):
+        assert classify_url("https://www.linkedin.com/in/someone") is None
+        assert classify_url("https://www.linkedin.com/company/acme") is None
+
+    def test_other_url_is_categorized(self):
+        assert classify_url("https://github.com/user/repo") == {
+            "domain": "github.com",
+            "type": "repository",
+        }
+
+    def test_linkedin_pulse_is_categorized(self):
+        result = classify_url("https://www.linkedin.com/pulse/some-article")
+        assert result == {"domain": "linkedin.com", "type": "article"}
+
+    def test_short_link_resolving_to_profile_is_dropped(self):
+        with (
+            patch(
+                "linkedin_api.extract_resources._try_resolve_redirect",
+                return_value="https://www.linkedin.com/in/someone",
+            ),
+            patch(
+                "linkedin_api.extract_resources.fetch_final_url_and_title",
+                side_effect=lambda u: (u, None),
+            ),
+        ):
+            rows = build_resource_rows(
+                "urn:li:share:1",
+                ["https://lnkd.in/abc", "https://github.com/user/repo"],
+            )
+        assert [row["url"] for row in rows] == ["https://github.com/user/repo"]
+
+    def test_title_only_kept_for_title_types(self):
+        with patch(
+            "linkedin_api.extract_resources.fetch_final_url_and_title",
+            side_effect=lambda u: (u, "A title"),
+        ):
+            rows = build_resource_rows(
+                "urn:li:share:1",
+                ["https://example.com/chart.png", "https://github.com/user/repo"],
+            )
+        assert [(row["type"], row["title"]) for row in rows] == [
+            ("image", None),
+            ("repository", "A title"),
+        ]
+
+    def test_canonical_hosts_skip_http(self):
+        with (
+            patch(
+                "linkedin_api.extract_resources._try_resolve_redirect"
+            ) as mock_resolve,
+            patch(
+                "linkedin_api.extract_resources.fetch_final_url_and_title"
+            ) as mock_fetch,
+        ):
+            rows = build_resource_rows(
+                "urn:li:share:1", ["https://www.youtube.com/watch?v=abc"]
+            )
+        assert [(row["type"], row["title"]) for row in rows] == [("video", None)]
+        mock_resolve.assert_not_called()
+        mock_fetch.assert_not_called()
+
+    def test_canonical_hosts_never_need_titles(self):
+        for host in extract_resources.CANONICAL_HOSTS:
+            url_type = categorize_url(f"https://{host}/x")["type"]
+            assert url_type not in extract_resources.TITLE_RESOURCE_TYPES
+
+    def test_short_link_title_fetched_from_resolved_url(self):
+        with (
+            patch(
+                "linkedin_api.extract_resources._try_resolve_redirect",
+                return_value="https://github.com/user/repo",
+            ),
+            patch(
+                "linkedin_api.extract_resources.fetch_final_url_and_title",
+                side_effect=lambda u: (u, "A title"),
+            ) as mock_fetch,
+        ):
+            rows = build_resource_rows("urn:li:share:1", ["https://lnkd.in/abc"])
+        assert [(row["url"], row["title"]) for row in rows] == [
+            ("https://github.com/user/repo", "A title")
+        ]
+        mock_fetch.assert_called_once_with("https://github.com/user/repo")
+
+    def test_shared_url_is_enriched_once(self):
+        with patch(
+            "linkedin_api.extract_resources._enrich_url",
+            side_effect=lambda u: {
+                "url": u,
+                "domain": "github.com",
+                "type": "repository",
+                "title": None,
+            },
+        ) as mock_enrich:
+            rows = build_resource_rows_by_source(
+                {
+                    "urn:li:share:1": ["https://github.com/a/one"],
+                    "urn:li:share:2": ["https://github.com/a/one"],
+                }
+            )
+        assert [row["source_urn"] for row in rows] == [
+            "urn:li:share:1",
+            "urn:li:share:2",
+        ]
+        mock_enrich.assert_called_once_with("https://github.com/a/one")
+
+    def test_url_cache_skips_known_urls_and_records_new_ones(self):
+        cached = {
+            "url": "https://github.com/a/one",
+            "domain": "github.com",
+            "type": "repository",
+            "title": "One",
+        }
+        url_cache = {"https://github.com/a/one": cached}
+        with patch(
+            "linkedin_api.extract_resources.fetch_final_url_and_title",
+            side_effect=lambda u: (u, None),
+        ) as mock_fetch:
+            rows = build_resource_rows_by_source(
+                {
+                    "urn:li:share:1": [
+                        "https://github.com/a/one",
+                        "https://github.com/a/two",
+                    ]
+                },
+                url_cache,
+            )
+        assert [row["title"] for row in rows] == ["One", None]
+        mock_fetch.assert_called_once_with("https://github.com/a/two")
+        assert set(url_cache) == {
+            "https://github.com/a/one",
+            "https://github.com/a/two",
+        }
+
+    @patch("linkedin_api.extract_resources.requests.Session.head")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_network_failures_are_not_cached(self, mock_get, mock_head):
+        mock_get.side_effect = requests.ConnectionError("unreachable")
+        mock_head.side_effect = requests.ConnectionError("unreachable")
+        url_cache: dict = {}
+
+        rows = build_resource_rows_by_source(
+            {"urn:li:share:1": ["https://github.com/a/one", "https://lnkd.in/abc"]},
+            url_cache,
+        )
+
+        assert rows == []
+        assert url_cache == {}
+
+    @pytest.mark.parametrize("status,cached", [(429, False), (500, False), (404, True)])
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_only_final_http_errors_are_cached(self, mock_get, status, cached):
+        mock_response = MagicMock()
+        mock_response.url = "https://github.com/a/one"
+        mock_response.status_code = status
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status} error", response=mock_response
+        )
+        mock_get.return_value = mock_response
+        url_cache: dict = {}
+
+        build_resource_rows_by_source(
+            {"urn:li:share:1": ["https://github.com/a/one"]}, url_cache
+        )
+
+        assert ("https://github.com/a/one" in url_cache) is cached
+
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_rate_limited_short_link_is_not_cached(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.url = "https://lnkd.in/abc"
+        mock_response.status_code = 429
+        mock_get.return_value = mock_response
+        url_cache: dict = {}
+
+        build_resource_rows_by_source(
+            {"urn:li:share:1": ["https://lnkd.in/abc"]}, url_cache
+        )
+
+        assert url_cache == {}
+
+    def test_url_cache_round_trips_through_data_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LINKEDIN_DATA_DIR", str(tmp_path))
+        assert load_url_cache() == {}
+
+        row = {"url": "https://x.org", "type": "article", "fetched_at": time.time()}
+        save_url_cache({"https://x.org": row})
+        assert load_url_cache() == {"https://x.org": row}
+        assert list(tmp_path.iterdir()) == [
+            tmp_path / extract_resources.URL_CACHE_FILENAME
+        ]
+
+        (tmp_path / extract_resources.URL_CACHE_FILENAME).write_text("not json")
+        assert load_url_cache() == {}
+
+    def test_url_cache_drops_expired_rows(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LINKEDIN_DATA_DIR", str(tmp_path))
+        max_age = extract_resources.URL_CACHE_MAX_AGE.total_seconds()
+        fresh = {"url": "https://x.org/new", "fetched_at": time.time()}
+        stale = {"url": "https://x.org/old", "fetched_at": time.time() - max_age - 1}
+        save_url_cache({fresh["url"]: fresh, stale["url"]: stale, "https://x.org": {}})
+
+        assert load_url_cache() == {fresh["url"]: fresh}
+
+    def test_url_cache_dropped_when_rules_change(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LINKEDIN_DATA_DIR", str(tmp_path))
+        row = {"url": "https://x.org", "fetched_at": time.time()}
+        save_url_cache({"https://x.org": row})
+
+        monkeypatch.setattr(
+            extract_resources, "ARTICLE_PATHS", ("/blog/", "/articles/")
+        )
+        assert load_url_cache() == {}
+
+    def test_new_cache_rows_are_timestamped_but_rows_are_not(self):
+        url_cache: dict = {}
+        with patch(
+            "linkedin_api.extract_resources.fetch_final_url_and_title",
+            side_effect=lambda u: (u, None),
+        ):
+            rows = build_resource_rows_by_source(
+                {"urn:li:share:1": ["https://github.com/a/one"]}, url_cache
+            )
+        assert "fetched_at" not in rows[0]
+        assert url_cache["https://github.com/a/one"]["fetched_at"] <= time.time()
+
+    def test_rows_keep_source_order_and_skip_failed_urls(self):
+        def fake_fetch(url):
+            if "broken" in url:
+                raise RuntimeError("boom")
+            return url, None
+
+        with patch(
+            "linkedin_api.extract_resources.fetch_final_url_and_title",
+            side_effect=fake_fetch,
+        ):
+            rows = build_resource_rows_by_source(
+                {
+                    "urn:li:share:1": [
+                        "https://github.com/a/one",
+                        "https://broken.example.com/x",
+                    ],
+                    "urn:li:comment:2": ["https://github.com/a/two"],
+                }
+            )
+        assert [(row["source_urn"], row["url"]) for row in rows] == [
+            ("urn:li:share:1", "https://github.com/a/one"),
+            ("urn:li:comment:2", "https://github.com/a/two"),
+        ]
+
+
 class TestResolveRedirect:
     """Test redirect resolution."""
 
-    @patch("linkedin_api.extract_resources.requests.head")
+    def test_shared_session_sends_browser_headers(self):
+        """Headers are set once on the pooled session, not per request."""
+        session = extract_resources._http_session()
+        assert "User-Agent" in session.headers
+        adapter = session.get_adapter("https://example.com")
+        assert adapter.max_retries.total == 2
+
+    def test_session_reused_per_thread(self):
+        """Each worker thread keeps its own session across calls."""
+        main_session = extract_resources._http_session()
+        assert extract_resources._http_session() is main_session
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_session = executor.submit(extract_resources._http_session).result()
+        assert worker_session is not main_session
+
+    def test_session_pool_sized_for_one_thread(self):
+        adapter = extract_resources.build_http_session().get_adapter(
+            "https://example.com"
+        )
+        assert adapter._pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+
+    def test_worker_sessions_closed_after_pool(self):
+        used = []
+
+        def fake_enrich(url):
+            used.append(extract_resources._http_session())
+            return None
+
+        with (
+            patch(
+                "linkedin_api.extract_resources._enrich_url", side_effect=fake_enrich
+            ),
+            patch.object(requests.Session, "close", autospec=True) as mock_close,
+        ):
+            build_resource_rows_by_source(
+                {"urn:li:share:1": ["https://github.com/a/one", "https://x.org/b"]}
+            )
+        closed = {id(call.args[0]) for call in mock_close.call_args_list}
+        assert used and {id(session) for session in used} <= closed
+
+    @patch("linkedin_api.extract_resources.requests.Session.head")
     def test_resolve_redirect_success(self, mock_head):
         """Test successful redirect resolution with HEAD."""
         mock_response = MagicMock()
@@ -153,14 +507,20 @@ class TestResolveRedirect:
 
         result = resolve_redirect("https://short.ly/abc")
         assert result == "https://final-url.com"
-        # Verify headers are passed
         mock_head.assert_called_once()
-        call_kwargs = mock_head.call_args[1]
-        assert "headers" in call_kwargs
-        assert "User-Agent" in call_kwargs["headers"]
 
-    @patch("linkedin_api.extract_resources.requests.head")
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.head")
+    def test_resolve_redirect_is_cached_per_url(self, mock_head):
+        mock_response = MagicMock()
+        mock_response.url = "https://final-url.com"
+        mock_head.return_value = mock_response
+
+        assert resolve_redirect("https://short.ly/abc") == "https://final-url.com"
+        assert resolve_redirect("https://short.ly/abc") == "https://final-url.com"
+        mock_head.assert_called_once()
+
+    @patch("linkedin_api.extract_resources.requests.Session.head")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_resolve_redirect_fallback_to_get(self, mock_get, mock_head):
         """Test fallback to GET when HEAD fails."""
         mock_head.side_effect = Exception("HEAD failed")
@@ -170,14 +530,10 @@ class TestResolveRedirect:
 
         result = resolve_redirect("https://short.ly/abc")
         assert result == "https://final-url.com"
-        # Verify GET was called with headers
         mock_get.assert_called_once()
-        call_kwargs = mock_get.call_args[1]
-        assert "headers" in call_kwargs
-        assert "User-Agent" in call_kwargs["headers"]
 
-    @patch("linkedin_api.extract_resources.requests.head")
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.head")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_resolve_redirect_head_same_url_fallback_to_get(self, mock_get, mock_head):
         """Test that GET is tried when HEAD returns same URL."""
         # HEAD returns same URL (no redirect detected)
@@ -196,8 +552,8 @@ class TestResolveRedirect:
         assert mock_head.called
         assert mock_get.called
 
-    @patch("linkedin_api.extract_resources.requests.head")
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.head")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_resolve_redirect_returns_original_on_failure(self, mock_get, mock_head):
         """Test that original URL is returned when both HEAD and GET fail."""
         mock_head.side_effect = Exception("HEAD failed")
@@ -207,8 +563,8 @@ class TestResolveRedirect:
         result = resolve_redirect(original_url)
         assert result == original_url
 
-    @patch("linkedin_api.extract_resources.requests.head")
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.head")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_resolve_no_redirect(self, mock_get, mock_head):
         """Test that non-redirecting URLs return unchanged."""
         mock_response = MagicMock()
@@ -224,11 +580,13 @@ class TestResolveRedirect:
 class TestExtractTitleFromUrl:
     """Test title extraction from URLs."""
 
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_extract_title_from_html(self, mock_get):
         """Test extracting title from HTML page."""
         mock_response = MagicMock()
-        mock_response.text = "<html><head><title>Test Title</title></head></html>"
+        mock_response.raw.read.return_value = (
+            b"<html><head><title>Test Title</title></head></html>"
+        )
         mock_response.headers = {"content-type": "text/html"}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
@@ -236,12 +594,27 @@ class TestExtractTitleFromUrl:
         title = extract_title_from_url("https://example.com")
         assert title == "Test Title"
 
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_extract_title_reads_only_page_head(self, mock_get):
+        """The body is streamed and capped instead of downloaded whole."""
+        mock_response = MagicMock()
+        mock_response.raw.read.return_value = b"<title>Capped</title>"
+        mock_response.headers = {"content-type": "text/html; charset=utf-8"}
+        mock_get.return_value = mock_response
+
+        assert extract_title_from_url("https://example.com/long") == "Capped"
+        assert mock_get.call_args[1]["stream"] is True
+        mock_response.raw.read.assert_called_once_with(
+            extract_resources.TITLE_MAX_BYTES, decode_content=True
+        )
+        mock_response.close.assert_called_once()
+
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_extract_title_from_og_tag(self, mock_get):
         """Test extracting title from Open Graph tag."""
         mock_response = MagicMock()
-        mock_response.text = (
-            '<html><head><meta property="og:title" content="OG Title" /></head></html>'
+        mock_response.raw.read.return_value = (
+            b'<html><head><meta property="og:title" content="OG Title" /></head></html>'
         )
         mock_response.headers = {"content-type": "text/html"}
         mock_response.raise_for_status = MagicMock()
@@ -250,11 +623,14 @@ class TestExtractTitleFromUrl:
         title = extract_title_from_url("https://example.com")
         assert title == "OG Title"
 
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_extract_title_from_twitter_card(self, mock_get):
         """Test extracting title from Twitter Card tag."""
         mock_response = MagicMock()
-        mock_response.text = '<html><head><meta name="twitter:title" content="Twitter Title" /></head></html>'
+        mock_response.raw.read.return_value = (
+            b'<html><head><meta name="twitter:title" content="Twitter Title" />'
+            b"</head></html>"
+        )
         mock_response.headers = {"content-type": "text/html"}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
@@ -262,7 +638,7 @@ class TestExtractTitleFromUrl:
         title = extract_title_from_url("https://example.com")
         assert title == "Twitter Title"
 
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_extract_title_non_html_content(self, mock_get):
         """Test that non-HTML content returns None."""
         mock_response = MagicMock()
@@ -272,7 +648,7 @@ class TestExtractTitleFromUrl:
         title = extract_title_from_url("https://example.com/api")
         assert title is None
 
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_extract_title_request_failure(self, mock_get):
         """Test that request failures return None."""
         mock_get.side_effect = Exception("Request failed")
@@ -281,11 +657,209 @@ class TestExtractTitleFromUrl:
         assert title is None
 
 
+class TestFetchFinalUrlAndTitle:
+    """Test the single-GET redirect + title lookup."""
+
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_returns_final_url_and_title(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.url = "https://example.com/final"
+        mock_response.headers = {"content-type": "text/html"}
+        mock_response.raw.read.return_value = b"<title>Final</title>"
+        mock_get.return_value = mock_response
+
+        result = fetch_final_url_and_title("https://example.com/start")
+        assert result == ("https://example.com/final", "Final")
+        mock_get.assert_called_once()
+        mock_response.close.assert_called_once()
+
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_keeps_final_url_when_page_fails(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.url = "https://example.com/final"
+        mock_response.raise_for_status.side_effect = Exception("404")
+        mock_get.return_value = mock_response
+
+        result = fetch_final_url_and_title("https://example.com/start")
+        assert result == ("https://example.com/final", None)
+
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_request_failure_returns_none(self, mock_get):
+        mock_get.side_effect = requests.Timeout("timeout")
+
+        assert fetch_final_url_and_title("https://example.com/start") is None
+
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    def test_dropped_connection_while_reading_returns_none(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.url = "https://example.com/final"
+        mock_response.headers = {"content-type": "text/html"}
+        mock_response.raw.read.side_effect = ProtocolError("connection reset")
+        mock_get.return_value = mock_response
+
+        assert fetch_final_url_and_title("https://example.com/start") is None
+
+
+class TestExtractResourcesFromJson:
+    """Test URL extraction from a saved neo4j_data export."""
+
+    def test_reads_posts_and_comments(self, tmp_path):
+        path = tmp_path / "neo4j_data.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "nodes": [
+                        {
+                            "id": "urn:li:share:1",
+                            "labels": ["Post"],
+                            "properties": {
+                                "urn": "urn:li:share:1",
+                                "extracted_urls": ["https://example.com/a"],
+                            },
+                        },
+                        {
+                            "id": "c1",
+                            "labels": ["Comment"],
+                            "properties": {
+                                "urn": "c1",
+                                "text": "See https://example.org/b.",
+                            },
+                        },
+                        {
+                            "id": "urn:li:person:x",
+                            "labels": ["Person"],
+                            "properties": {"urn": "urn:li:person:x"},
+                        },
+                    ],
+                    "relationships": [],
+                    "statistics": {},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        resources = extract_resources_from_json(str(path))
+
+        assert resources == {
+            "posts": {"urn:li:share:1": ["https://example.com/a"]},
+            "comments": {"c1": ["https://example.org/b"]},
+        }
+
+
+class TestGetPostsWithContent:
+    """Test the Neo4j post read."""
+
+    def test_limit_is_passed_as_parameter(self):
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        session.run.return_value = [
+            {"urn": "urn:li:share:1", "text": "hi", "url": None}
+        ]
+
+        posts = get_posts_with_content(driver, limit=5)
+
+        query = session.run.call_args[0][0]
+        assert query.rstrip().endswith("LIMIT $limit")
+        assert session.run.call_args[1] == {"limit": 5}
+        assert posts == [{"urn": "urn:li:share:1", "text": "hi", "url": None}]
+
+
+class TestWriteResourceRows:
+    """Test batched Resource writes."""
+
+    def _rows(self, n, source_urn="urn:li:share:1"):
+        return [
+            {
+                "source_urn": source_urn,
+                "url": f"https://example.com/{i}",
+                "domain": "example.com",
+                "type": "article",
+                "title": None,
+            }
+            for i in range(n)
+        ]
+
+    def test_rows_are_written_in_batches_over_one_session(self, monkeypatch):
+        """Rows are chunked by RESOURCE_BATCH_SIZE and counts merged per source."""
+        monkeypatch.setattr(extract_resources, "RESOURCE_BATCH_SIZE", 2)
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+
+        def execute_write(fn, batch, *args):
+            if fn is create_references_batch:
+                return {batch[0]["source_urn"]: len(batch)}
+            return None
+
+        session.execute_write.side_effect = execute_write
+
+        created = write_resource_rows(driver, self._rows(5), source_type="Post")
+
+        assert created == {"urn:li:share:1": 5}
+        assert driver.session.call_count == 1
+        calls = [c.args for c in session.execute_write.call_args_list]
+        assert [c[0] for c in calls] == [merge_resources_batch] * 3 + [
+            create_references_batch
+        ] * 3
+        fn, batch, source_type = calls[3]
+        assert len(batch) == 2
+        assert source_type == "Post"
+
+    def test_shared_url_is_merged_once(self):
+        """A URL referenced by several sources becomes one Resource row."""
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        session.execute_write.return_value = {}
+        rows = self._rows(1, "urn:li:share:1") + self._rows(1, "urn:li:share:2")
+        rows[1]["title"] = "Example"
+
+        write_resource_rows(driver, rows, source_type="Post")
+
+        fn, resources = session.execute_write.call_args_list[0].args
+        assert fn is merge_resources_batch
+        assert resources == [
+            {
+                "url": "https://example.com/0",
+                "domain": "example.com",
+                "type": "article",
+                "title": "Example",
+            }
+        ]
+
+    def test_ensure_resource_indexes_is_idempotent(self):
+        """Index creation only uses IF NOT EXISTS statements."""
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+
+        ensure_resource_indexes(driver, database="graph")
+
+        driver.session.assert_called_once_with(database="graph")
+        queries = [c.args[0] for c in session.run.call_args_list]
+        assert len(queries) == 3
+        assert all("IF NOT EXISTS" in q for q in queries)
+        assert any("(n:Resource) ON (n.url)" in q for q in queries)
+
+    def test_references_query_unwinds_rows(self):
+        """A single UNWIND query is run for the whole batch."""
+        tx = MagicMock()
+        tx.run.return_value = [{"source_urn": "urn:li:share:1", "created": 3}]
+        rows = self._rows(3)
+
+        counts = create_references_batch(tx, rows, "Comment")
+
+        assert counts == {"urn:li:share:1": 3}
+        assert tx.run.call_count == 1
+        query = tx.run.call_args.args[0]
+        assert "UNWIND $rows AS row" in query
+        assert "MATCH (source:Comment" in query
+        assert "MATCH (resource:Resource" in query
+        assert tx.run.call_args.kwargs["rows"] is rows
+
+
 class TestLnkdInRedirect:
     """Test lnkd.in redirect handling (example from ticket LUC-11)."""
 
-    @patch("linkedin_api.extract_resources.requests.get")
-    @patch("linkedin_api.extract_resources.requests.head")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
+    @patch("linkedin_api.extract_resources.requests.Session.head")
     def test_resolve_lnkd_in_redirect_via_get_skips_head(self, mock_head, mock_get):
         """Test that lnkd.in URLs skip HEAD and use GET with HTML parsing."""
         # Mock GET response with HTML containing the final URL (and LinkedIn static assets)
@@ -308,12 +882,8 @@ class TestLnkdInRedirect:
         mock_get.assert_called_once()
         # HEAD should NOT be called for lnkd.in URLs
         mock_head.assert_not_called()
-        # Verify headers are passed
-        call_kwargs = mock_get.call_args[1]
-        assert "headers" in call_kwargs
-        assert "User-Agent" in call_kwargs["headers"]
 
-    @patch("linkedin_api.extract_resources.requests.get")
+    @patch("linkedin_api.extract_resources.requests.Session.get")
     def test_resolve_lnkd_in_filters_static_assets(self, mock_get):
         """Test that lnkd.in URL parsing filters out LinkedIn static assets."""
         mock_response = MagicMock()
@@ -10,6 +10,7 @@ from linkedin_api.utils.urls import (
     is_linkedin_internal_url,
     resolve_redirect,
     should_ignore_url,
+    url_host_and_path,
 )
 
 
@@ -34,6 +35,22 @@ class TestExtractUrlsFromText:
         urls = extract_urls_from_text(text)
         assert len(urls) == 1
 
+    def test_keeps_first_seen_order(self):
+        text = "https://c.com, https://a.com (https://c.com) and https://b.com."
+        assert extract_urls_from_text(text) == [
+            "https://c.com",
+            "https://a.com",
+            "https://b.com",
+        ]
+
+    def test_trailing_punctuation_not_captured(self):
+        text = "See (https://a.com/x). Also https://b.com/y)!, https://c.com/z?."
+        assert extract_urls_from_text(text) == [
+            "https://a.com/x",
+            "https://b.com/y",
+            "https://c.com/z",
+        ]
+
 
 class TestLinkedinSignupRedirectHashtag:
     def test_extracts_hashtag_from_signup_redirect(self):
@@ -156,6 +173,27 @@ class TestIsLinkedinInternalUrl:
         assert is_linkedin_internal_url("https://github.com/x") is False
 
 
+class TestUrlHostAndPath:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://WWW.Example.com/Blog/Post?utm_source=x#top",
+            "http://user@host.com:8080/a/b;params",
+            "https://host.com?q=/path",
+            "https://host.com#frag/x",
+            "https://host.com",
+            "ftp://files.example.org/pub/file.pdf",
+            "//cdn.example.com/lib.js",
+            "not a url",
+        ],
+    )
+    def test_matches_urlparse(self, url):
+        from urllib.parse import urlparse
+
+        parsed = urlparse(url.lower())
+        assert url_host_and_path(url) == (parsed.netloc, parsed.path)
+
+
 class TestCategorizeUrl:
     def test_github(self):
         result = categorize_url("https://github.com/user/repo")